@@ -21,7 +21,8 @@ __version__ = "0.1.0"
 
 
 def generate(seed: int = 42, preset: str | None = None,
-             overrides: dict | None = None) -> Alphabet:
+             overrides: dict | None = None, workers: int = 1,
+             processes: bool = False) -> Alphabet:
     """Generate a complete 26-glyph alphabet.
 
     Args:
@@ -29,9 +30,12 @@ def generate(seed: int = 42, preset: str | None = None,
         preset: Optional named style preset (angular, flowing, geometric,
                 blocky, ornate, runic).
         overrides: Optional dict of style parameter overrides.
+        workers: Threads to build glyphs with (1 = serial).
+        processes: Use worker processes instead of threads.
 
     Returns:
         An Alphabet containing 26 Glyphs with matching style.
     """
-    gen = AlphabetGenerator(seed=seed, preset=preset, overrides=overrides)
+    gen = AlphabetGenerator(seed=seed, preset=preset, overrides=overrides,
+                            workers=workers, processes=processes)
     return gen.generate()
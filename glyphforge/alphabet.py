@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import string
 from dataclasses import dataclass, field
 from typing import Iterator
 
+import numpy as np
+
 from .glyph import Glyph
 from .style import AlphabetStyle
 
@@ -36,12 +39,40 @@ class Alphabet:
     def __iter__(self) -> Iterator[Glyph]:
         return iter(self.glyphs)
 
+    # -- Analysis -----------------------------------------------------------
+
+    @property
+    def feature_matrix(self) -> np.ndarray:
+        """(n, 7) array of the current glyphs' feature vectors.
+
+        Built on each access, so it always matches .glyphs; hold on to
+        the result to reuse it across checks.
+        """
+        from .validation import feature_matrix
+        return feature_matrix(self.glyphs)
+
+    def structural_digest(self) -> bytes:
+        """BLAKE2b digest of every glyph's template and outline points.
+
+        Two alphabets with equal digests have bit-identical outlines.
+        """
+        h = hashlib.blake2b()
+        for glyph in self.glyphs:
+            h.update(glyph.template_name.encode())
+            for arr in glyph.outline.arrays:
+                h.update(len(arr).to_bytes(4, "little"))
+                h.update(np.ascontiguousarray(arr, dtype=np.float64).tobytes())
+        return h.digest()
+
     # -- Export (delegated to svg_export / preview modules) ----------------
 
-    def to_svg(self, output_dir: str) -> list[str]:
-        """Export individual SVG files for each glyph. Returns file paths."""
+    def to_svg(self, output_dir: str, workers: int = 1) -> list[str]:
+        """Export individual SVG files for each glyph. Returns file paths.
+
+        workers > 1 writes the files from a thread pool.
+        """
         from .svg_export import export_individual
-        return export_individual(self, output_dir)
+        return export_individual(self, output_dir, workers=workers)
 
     def to_svg_sheet(self, path: str) -> str:
         """Export a specimen sheet with all 26 glyphs in a grid."""
@@ -3,125 +3,415 @@
 from __future__ import annotations
 
 import math
+from typing import Sequence
+
+import numpy as np
 
 from .geometry import Point
 from .glyph import CubicBezier
 
 
+def _power_basis(bez: CubicBezier) -> tuple[tuple[float, float, float, float],
+                                             tuple[float, float, float, float]]:
+    """Power-basis coefficients (A, B, C, D) per axis: A·t³ + B·t² + C·t + D."""
+    p0, p1, p2, p3 = bez.p0, bez.p1, bez.p2, bez.p3
+    return ((3 * (p1.x - p2.x) - p0.x + p3.x,
+             3 * (p0.x - 2 * p1.x + p2.x),
+             3 * (p1.x - p0.x),
+             p0.x),
+            (3 * (p1.y - p2.y) - p0.y + p3.y,
+             3 * (p0.y - 2 * p1.y + p2.y),
+             3 * (p1.y - p0.y),
+             p0.y))
+
+
 def evaluate(bez: CubicBezier, t: float) -> Point:
-    """Evaluate cubic bezier at parameter t ∈ [0, 1]."""
-    u = 1.0 - t
-    return (u * u * u * bez.p0 +
-            3 * u * u * t * bez.p1 +
-            3 * u * t * t * bez.p2 +
-            t * t * t * bez.p3)
+    """Evaluate cubic bezier at parameter t ∈ [0, 1] (Horner's method)."""
+    (ax, bx, cx, dx), (ay, by, cy, dy) = _power_basis(bez)
+    return Point(((ax * t + bx) * t + cx) * t + dx,
+                 ((ay * t + by) * t + cy) * t + dy)
+
+
+def evaluate_array(bez: CubicBezier,
+                   ts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate the curve at an array of t values. Returns (xs, ys).
+
+    Same Horner form as evaluate(), so each sample matches it exactly.
+    """
+    (ax, bx, cx, dx), (ay, by, cy, dy) = _power_basis(bez)
+    xs = ((ax * ts + bx) * ts + cx) * ts + dx
+    ys = ((ay * ts + by) * ts + cy) * ts + dy
+    return xs, ys
 
 
 def tangent(bez: CubicBezier, t: float) -> Point:
     """First derivative at parameter t (unnormalised tangent vector)."""
-    u = 1.0 - t
-    return (3 * u * u * (bez.p1 - bez.p0) +
-            6 * u * t * (bez.p2 - bez.p1) +
-            3 * t * t * (bez.p3 - bez.p2))
+    if bez.is_line:
+        return Point(bez.p3.x - bez.p0.x, bez.p3.y - bez.p0.y)
+    (ax, bx, cx, _), (ay, by, cy, _) = _power_basis(bez)
+    return Point((3 * ax * t + 2 * bx) * t + cx,
+                 (3 * ay * t + 2 * by) * t + cy)
 
 
 def normal(bez: CubicBezier, t: float) -> Point:
     """Unit normal (perpendicular to tangent, left-hand side)."""
     tan = tangent(bez, t)
-    perp = Point(-tan.y, tan.x)
-    ln = perp.length()
+    ln = math.hypot(tan.x, tan.y)
     if ln < 1e-12:
         return Point(0.0, 1.0)
-    return Point(perp.x / ln, perp.y / ln)
+    return Point(-tan.y / ln, tan.x / ln)
 
 
 def split(bez: CubicBezier, t: float) -> tuple[CubicBezier, CubicBezier]:
     """Split bezier at t using De Casteljau's algorithm."""
-    p01 = bez.p0.lerp(bez.p1, t)
-    p12 = bez.p1.lerp(bez.p2, t)
-    p23 = bez.p2.lerp(bez.p3, t)
-    p012 = p01.lerp(p12, t)
-    p123 = p12.lerp(p23, t)
-    p0123 = p012.lerp(p123, t)
-
-    left = CubicBezier(bez.p0, p01, p012, p0123)
-    right = CubicBezier(p0123, p123, p23, bez.p3)
+    p0, p1, p2, p3 = bez.p0, bez.p1, bez.p2, bez.p3
+    x01 = p0.x + (p1.x - p0.x) * t
+    y01 = p0.y + (p1.y - p0.y) * t
+    x12 = p1.x + (p2.x - p1.x) * t
+    y12 = p1.y + (p2.y - p1.y) * t
+    x23 = p2.x + (p3.x - p2.x) * t
+    y23 = p2.y + (p3.y - p2.y) * t
+    x012 = x01 + (x12 - x01) * t
+    y012 = y01 + (y12 - y01) * t
+    x123 = x12 + (x23 - x12) * t
+    y123 = y12 + (y23 - y12) * t
+    mid = Point(x012 + (x123 - x012) * t, y012 + (y123 - y012) * t)
+
+    # Both halves of a line are lines
+    line = bez.is_line
+    left = CubicBezier(p0, Point(x01, y01), Point(x012, y012), mid, line)
+    right = CubicBezier(mid, Point(x123, y123), Point(x23, y23), p3, line)
     return left, right
 
 
 def flatten(bez: CubicBezier, tolerance: float = 0.5) -> list[Point]:
     """Approximate bezier as a polyline within pixel tolerance.
 
-    Uses recursive subdivision — flatness test based on max deviation
-    of control points from the chord.
+    Nearly-straight curves collapse to their chord.  Otherwise the cubic
+    is split into quadratics and each is flattened analytically (Levien's
+    parabola-integral method), so samples concentrate where the curve
+    bends instead of being spread uniformly in t.
+    """
+    xs, ys = flatten_array(bez, tolerance).T.tolist()
+    return list(map(Point, xs, ys))
+
+
+def flatten_array(bez: CubicBezier, tolerance: float = 0.5) -> np.ndarray:
+    """Like flatten(), but returns the polyline as an (N, 2) float array."""
+    if bez.is_line or _is_flat(bez, tolerance):
+        return np.array([[bez.p0.x, bez.p0.y], [bez.p3.x, bez.p3.y]])
+    points = _flatten_quadratics(bez, tolerance)
+    # Pin the ends exactly so consecutive segments join without drift
+    points[0] = bez.p0.x, bez.p0.y
+    points[-1] = bez.p3.x, bez.p3.y
+    return points
+
+
+def _is_flat(bez: CubicBezier, tolerance: float) -> bool:
+    """True if both control points lie within tolerance of the chord P0→P3.
+
+    Compares squared cross products against tolerance² · |chord|², which
+    avoids the square root and divisions of an explicit distance.
+    """
+    p0, p1, p2, p3 = bez.p0, bez.p1, bez.p2, bez.p3
+    cx = p3.x - p0.x
+    cy = p3.y - p0.y
+    c2 = cx * cx + cy * cy
+    ux, uy = p1.x - p0.x, p1.y - p0.y
+    vx, vy = p2.x - p0.x, p2.y - p0.y
+    tol2 = tolerance * tolerance
+    if c2 < 1e-24:
+        return ux * ux + uy * uy <= tol2 and vx * vx + vy * vy <= tol2
+    cross1 = ux * cy - uy * cx
+    cross2 = vx * cy - vy * cx
+    return max(cross1 * cross1, cross2 * cross2) <= tol2 * c2
+
+
+# Share of the flattening tolerance spent on the cubic → quadratic step
+_QUAD_TOL_SHARE = 0.1
+
+
+def _quad_count(bez: CubicBezier, tolerance: float) -> int:
+    """Quadratics needed to approximate the cubic within tolerance.
+
+    The error of the mid-point quadratic fit scales with the cubic's
+    third difference: err = √3/36 · |P3 − 3P2 + 3P1 − P0| / n³.
     """
-    result: list[Point] = [bez.p0]
-    _flatten_recursive(bez, tolerance, result)
-    return result
+    p0, p1, p2, p3 = bez.p0, bez.p1, bez.p2, bez.p3
+    err2 = ((p3.x - 3 * p2.x + 3 * p1.x - p0.x) ** 2 +
+            (p3.y - 3 * p2.y + 3 * p1.y - p0.y) ** 2)
+    return max(1, math.ceil((err2 / (432.0 * tolerance * tolerance))
+                            ** (1 / 6)))
+
+
+def _approx_integral(x: float) -> float:
+    """Closed-form fit to ∫ (1 + 4x²)^-¼ dx, the parabola flattening measure."""
+    d = 0.67
+    return x / (1 - d + math.sqrt(math.sqrt(d ** 4 + 0.25 * x * x)))
+
+
+def _approx_inv_integral(x: float) -> float:
+    """Inverse of _approx_integral."""
+    b = 0.39
+    return x * (1 - b + math.sqrt(b * b + 0.25 * x * x))
 
 
-def _flatness(bez: CubicBezier) -> float:
-    """Max distance of control points from the chord P0→P3."""
-    chord = bez.p3 - bez.p0
-    chord_len = chord.length()
-    if chord_len < 1e-12:
-        return max((bez.p1 - bez.p0).length(), (bez.p2 - bez.p0).length())
-    nx, ny = -chord.y / chord_len, chord.x / chord_len
-    d1 = abs((bez.p1.x - bez.p0.x) * nx + (bez.p1.y - bez.p0.y) * ny)
-    d2 = abs((bez.p2.x - bez.p0.x) * nx + (bez.p2.y - bez.p0.y) * ny)
-    return max(d1, d2)
+def _approx_integral_array(x: np.ndarray) -> np.ndarray:
+    """_approx_integral over an array."""
+    d = 0.67
+    return x / (1 - d + np.sqrt(np.sqrt(d ** 4 + 0.25 * x * x)))
 
 
-def _flatten_recursive(bez: CubicBezier, tolerance: float,
-                        result: list[Point]) -> None:
-    if _flatness(bez) <= tolerance:
-        result.append(bez.p3)
-        return
-    left, right = split(bez, 0.5)
-    _flatten_recursive(left, tolerance, result)
-    _flatten_recursive(right, tolerance, result)
+def _approx_inv_integral_array(x: np.ndarray) -> np.ndarray:
+    """_approx_inv_integral over an array."""
+    b = 0.39
+    return x * (1 - b + np.sqrt(b * b + 0.25 * x * x))
+
+
+def _flatten_quadratics(bez: CubicBezier, tolerance: float) -> np.ndarray:
+    """Flatten via quadratics: returns the polyline as an (N, 2) array.
+
+    The cubic is cut into n quadratics at uniform t.  Each quadratic is
+    mapped onto a segment of the standard parabola y = x², where the
+    number of chords meeting the tolerance, and their spacing, follow
+    from an integral with a closed-form approximation.
+    """
+    quad_tol = tolerance * _QUAD_TOL_SHARE
+    sqrt_tol = math.sqrt(tolerance - quad_tol)
+    n = _quad_count(bez, quad_tol)
+    (ax, bx, cx, dx), (ay, by, cy, dy) = _power_basis(bez)
+    dt4 = 0.25 / n
+
+    xs: list[float] = []
+    ys: list[float] = []
+    x2, y2 = dx, dy
+    tx2, ty2 = cx, cy
+    for i in range(n):
+        # Quadratic fit per subsegment: ends on the cubic, control point
+        # from the end derivatives.
+        t = (i + 1) / n
+        x0, y0, tx0, ty0 = x2, y2, tx2, ty2
+        x2 = ((ax * t + bx) * t + cx) * t + dx
+        y2 = ((ay * t + by) * t + cy) * t + dy
+        tx2 = (3 * ax * t + 2 * bx) * t + cx
+        ty2 = (3 * ay * t + 2 * by) * t + cy
+        x1 = 0.5 * (x0 + x2) + dt4 * (tx0 - tx2)
+        y1 = 0.5 * (y0 + y2) + dt4 * (ty0 - ty2)
+
+        # Map the quadratic onto the parabola: u0, u2 are its end abscissae
+        ddx = 2 * x1 - x0 - x2
+        ddy = 2 * y1 - y0 - y2
+        cross = (x2 - x0) * ddy - (y2 - y0) * ddx
+        dd = math.hypot(ddx, ddy)
+        count = 1
+        if abs(cross) > 1e-12 * dd * dd:
+            u0 = ((x1 - x0) * ddx + (y1 - y0) * ddy) / cross
+            u2 = ((x2 - x1) * ddx + (y2 - y1) * ddy) / cross
+            scale = abs(cross / (dd * (u2 - u0)))
+            a0 = _approx_integral(u0)
+            a2 = _approx_integral(u2)
+            da = abs(a2 - a0)
+            sqrt_scale = math.sqrt(scale)
+            if (u0 < 0) == (u2 < 0):
+                val = da * sqrt_scale
+            else:
+                val = sqrt_tol * da / _approx_integral(sqrt_tol / sqrt_scale)
+            count = max(1, math.ceil(0.5 * val / sqrt_tol))
+
+        xs.append(x0)
+        ys.append(y0)
+        if count > 1:
+            # Evenly spaced in the integral, mapped back to the
+            # quadratic's own parameter.
+            v0 = _approx_inv_integral(a0)
+            vscale = 1 / (_approx_inv_integral(a2) - v0)
+            for k in range(1, count):
+                s = (_approx_inv_integral(a0 + (a2 - a0) * k / count)
+                     - v0) * vscale
+                r = 1 - s
+                xs.append(r * r * x0 + 2 * r * s * x1 + s * s * x2)
+                ys.append(r * r * y0 + 2 * r * s * y1 + s * s * y2)
+    xs.append(x2)
+    ys.append(y2)
+    return np.column_stack((xs, ys))
+
+
+def flatten_many(beziers: np.ndarray,
+                 tolerance: float = 0.5) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten many cubics in one pass.
+
+    beziers is an (M, 4, 2) array of control points.  Returns the stacked
+    polylines as an (N, 2) array and M + 1 offsets: curve i's polyline is
+    points[offsets[i]:offsets[i + 1]].  The result equals flatten_array
+    curve by curve, bit for bit, as it follows the same operation order;
+    this only pays off for dozens of curves, since the NumPy overhead is
+    fixed per call rather than per curve.
+    """
+    b = np.asarray(beziers, dtype=np.float64).reshape(-1, 4, 2)
+    m = len(b)
+    p0, p1, p2, p3 = b[:, 0], b[:, 1], b[:, 2], b[:, 3]
+
+    # Chord flatness, as in _is_flat
+    c = p3 - p0
+    u = p1 - p0
+    v = p2 - p0
+    tol2 = tolerance * tolerance
+    c2 = np.einsum("ij,ij->i", c, c)
+    cross1 = u[:, 0] * c[:, 1] - u[:, 1] * c[:, 0]
+    cross2 = v[:, 0] * c[:, 1] - v[:, 1] * c[:, 0]
+    flat = np.where(
+        c2 < 1e-24,
+        np.maximum(np.einsum("ij,ij->i", u, u),
+                   np.einsum("ij,ij->i", v, v)) <= tol2,
+        np.maximum(cross1 * cross1, cross2 * cross2) <= tol2 * c2)
+
+    # Quadratic counts, as in _quad_count; flat curves emit one chord
+    quad_tol = tolerance * _QUAD_TOL_SHARE
+    sqrt_tol = math.sqrt(tolerance - quad_tol)
+    d3 = p3 - 3 * p2 + 3 * p1 - p0
+    err2 = np.einsum("ij,ij->i", d3, d3)
+    n = np.maximum(1, np.ceil((err2 / (432.0 * quad_tol * quad_tol))
+                              ** (1 / 6))).astype(np.intp)
+    n[flat] = 1
+
+    # One row per quadratic: ends on the cubic, control point from the
+    # end derivatives
+    a = 3 * (p1 - p2) - p0 + p3
+    bb = 3 * (p0 - 2 * p1 + p2)
+    cc = 3 * (p1 - p0)
+    qc = np.repeat(np.arange(m), n)
+    nq = n[qc]
+    qi = np.arange(len(qc)) - (np.cumsum(n) - n)[qc]
+    t0 = (qi / nq)[:, None]
+    t1 = ((qi + 1) / nq)[:, None]
+    aq, bq, cq, dq = a[qc], bb[qc], cc[qc], p0[qc]
+    q0 = ((aq * t0 + bq) * t0 + cq) * t0 + dq
+    q2 = ((aq * t1 + bq) * t1 + cq) * t1 + dq
+    tan0 = (3 * aq * t0 + 2 * bq) * t0 + cq
+    tan2 = (3 * aq * t1 + 2 * bq) * t1 + cq
+    q1 = 0.5 * (q0 + q2) + (0.25 / nq)[:, None] * (tan0 - tan2)
+
+    # Parabola mapping and chord counts, as in _flatten_quadratics
+    dd = 2 * q1 - q0 - q2
+    e02 = q2 - q0
+    cross = e02[:, 0] * dd[:, 1] - e02[:, 1] * dd[:, 0]
+    ddn = np.hypot(dd[:, 0], dd[:, 1])
+    curved = np.flatnonzero((np.abs(cross) > 1e-12 * ddn * ddn) & ~flat[qc])
+    counts = np.ones(len(qc), dtype=np.intp)
+    if len(curved):
+        ddc = dd[curved]
+        crc = cross[curved]
+        u0 = np.einsum("ij,ij->i", q1[curved] - q0[curved], ddc) / crc
+        u2 = np.einsum("ij,ij->i", q2[curved] - q1[curved], ddc) / crc
+        sqrt_scale = np.sqrt(np.abs(crc / (ddn[curved] * (u2 - u0))))
+        a0 = _approx_integral_array(u0)
+        a2 = _approx_integral_array(u2)
+        da = np.abs(a2 - a0)
+        val = np.where((u0 < 0) == (u2 < 0), da * sqrt_scale,
+                       sqrt_tol * da
+                       / _approx_integral_array(sqrt_tol / sqrt_scale))
+        counts[curved] = np.maximum(
+            1, np.ceil(0.5 * val / sqrt_tol)).astype(np.intp)
+
+    # Sample every quadratic at its start and its interior chord ends
+    sq = np.repeat(np.arange(len(qc)), counts)
+    k = np.arange(len(sq)) - (np.cumsum(counts) - counts)[sq]
+    s = np.zeros(len(sq))
+    inner = np.flatnonzero(k > 0)
+    if len(inner):
+        qq = sq[inner]
+        pos = np.searchsorted(curved, qq)
+        v0 = _approx_inv_integral_array(a0[pos])
+        vscale = 1 / (_approx_inv_integral_array(a2[pos]) - v0)
+        s[inner] = (_approx_inv_integral_array(
+            a0[pos] + (a2[pos] - a0[pos]) * k[inner] / counts[qq]) - v0) \
+            * vscale
+    s = s[:, None]
+    r = 1 - s
+    samples = r * r * q0[sq] + 2 * r * s * q1[sq] + s * s * q2[sq]
+
+    # Each curve's samples followed by its end point; ends pinned exactly
+    offsets = np.zeros(m + 1, dtype=np.intp)
+    np.cumsum(np.bincount(qc, weights=counts, minlength=m).astype(np.intp)
+              + 1, out=offsets[1:])
+    points = np.empty((offsets[-1], 2))
+    ends = offsets[1:] - 1
+    interior = np.ones(offsets[-1], dtype=bool)
+    interior[ends] = False
+    points[interior] = samples
+    points[offsets[:-1]] = p0
+    points[ends] = p3
+    return points, offsets
 
 
 def arc_length(bez: CubicBezier, steps: int = 32) -> float:
-    """Approximate arc length by evaluating at uniform t steps."""
+    """Approximate arc length by evaluating at uniform t steps.
+
+    Scalar Horner accumulation: at the default step count this beats a
+    NumPy pass, whose per-call overhead dominates for 33 samples.
+    """
+    (ax, bx, cx, dx), (ay, by, cy, dy) = _power_basis(bez)
+    hypot = math.hypot
+    prev_x, prev_y = dx, dy
     total = 0.0
-    prev = bez.p0
     for i in range(1, steps + 1):
         t = i / steps
-        cur = evaluate(bez, t)
-        total += prev.distance_to(cur)
-        prev = cur
+        x = ((ax * t + bx) * t + cx) * t + dx
+        y = ((ay * t + by) * t + cy) * t + dy
+        total += hypot(x - prev_x, y - prev_y)
+        prev_x, prev_y = x, y
     return total
 
 
 def make_line(p0: Point, p1: Point) -> CubicBezier:
     """Create a straight-line bezier from p0 to p1."""
-    return CubicBezier(p0, p0.lerp(p1, 1 / 3), p0.lerp(p1, 2 / 3), p1)
+    dx, dy = p1.x - p0.x, p1.y - p0.y
+    return CubicBezier(p0,
+                       Point(p0.x + dx * (1 / 3), p0.y + dy * (1 / 3)),
+                       Point(p0.x + dx * (2 / 3), p0.y + dy * (2 / 3)),
+                       p1, is_line=True)
 
 
-def make_arc(start: Point, end: Point, bulge: float) -> CubicBezier:
+def make_arc(start: Point, end: Point, bulge: float,
+             jitter: Sequence[float] | None = None) -> CubicBezier:
     """Create an arc-like bezier from start to end.
 
     bulge > 0: curve bows left (relative to start→end direction)
     bulge < 0: curve bows right
     bulge = 0: straight line
-    """
-    mid = start.lerp(end, 0.5)
-    chord = end - start
-    perp = Point(-chord.y, chord.x)
-    offset = perp * bulge
 
+    jitter, if given, is (dx1, dy1, dx2, dy2) added to the control points.
+    """
+    dx, dy = end.x - start.x, end.y - start.y
     # Control points at roughly 1/3 and 2/3 along the chord,
     # offset perpendicular to the chord
-    cp1 = start.lerp(end, 1 / 3) + offset * 0.8
-    cp2 = start.lerp(end, 2 / 3) + offset * 0.8
-    return CubicBezier(start, cp1, cp2, end)
+    ox = -dy * bulge * 0.8
+    oy = dx * bulge * 0.8
+    return _chord_curve(start, end, dx, dy, ox, oy, ox, oy, jitter)
 
 
-def make_s_curve(start: Point, end: Point, amplitude: float) -> CubicBezier:
+def make_s_curve(start: Point, end: Point, amplitude: float,
+                 jitter: Sequence[float] | None = None) -> CubicBezier:
     """S-curve: control points offset in opposite directions."""
-    chord = end - start
-    perp = Point(-chord.y, chord.x)
-    cp1 = start.lerp(end, 1 / 3) + perp * amplitude
-    cp2 = start.lerp(end, 2 / 3) - perp * amplitude
-    return CubicBezier(start, cp1, cp2, end)
+    dx, dy = end.x - start.x, end.y - start.y
+    ox = -dy * amplitude
+    oy = dx * amplitude
+    return _chord_curve(start, end, dx, dy, ox, oy, -ox, -oy, jitter)
+
+
+def _chord_curve(start: Point, end: Point, dx: float, dy: float,
+                 o1x: float, o1y: float, o2x: float, o2y: float,
+                 jitter: Sequence[float] | None) -> CubicBezier:
+    """Bezier with control points at 1/3 and 2/3 of the chord (dx, dy),
+    offset by o1 and o2, plus optional jitter."""
+    x1 = start.x + dx * (1 / 3) + o1x
+    y1 = start.y + dy * (1 / 3) + o1y
+    x2 = start.x + dx * (2 / 3) + o2x
+    y2 = start.y + dy * (2 / 3) + o2y
+    if jitter is not None:
+        jx1, jy1, jx2, jy2 = jitter
+        x1 += jx1
+        y1 += jy1
+        x2 += jx2
+        y2 += jy2
+    return CubicBezier(start, Point(x1, y1), Point(x2, y2), end)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import math
 
+import numpy as np
 import pyclipper
 
-from .bezier import evaluate, flatten, normal, tangent
+from . import settings
+from .bezier import flatten_array, flatten_many
 from .geometry import Point
 from .glyph import (
     CubicBezier,
@@ -14,6 +17,7 @@ from .glyph import (
     Outline,
     Skeleton,
     Stroke,
+    segment_arrays,
 )
 from .style import AlphabetStyle, CapStyle, JoinStyle, SerifStyle, StrokeWidthMode
 
@@ -21,102 +25,192 @@ from .style import AlphabetStyle, CapStyle, JoinStyle, SerifStyle, StrokeWidthMo
 # pyclipper works with integer coordinates — we scale to this space
 CLIPPER_SCALE = 1000.0
 
+# Finest flattening tolerance, in em units.  At the default 100 px sheet
+# cell this is under a pixel; pass a smaller value for print export.
+DEFAULT_RENDER_TOLERANCE = 0.01
 
-def _to_clipper(points: list[Point]) -> list[tuple[int, int]]:
-    return [(int(p.x * CLIPPER_SCALE), int(p.y * CLIPPER_SCALE))
-            for p in points]
+# Internally polylines and polygons are (N, 2) float64 arrays; Points
+# only appear where skeletons come in and where the Outline goes out.
+Polyline = np.ndarray
 
 
-def _from_clipper(path: list[tuple[int, int]]) -> list[Point]:
-    return [Point(x / CLIPPER_SCALE, y / CLIPPER_SCALE) for x, y in path]
+def _to_clipper(points: Polyline) -> list[list[int]]:
+    # Nested lists, not the ndarray itself: pyclipper accepts arrays but
+    # then unpacks them element by element, which is slower than tolist().
+    return np.rint(points * CLIPPER_SCALE).astype(np.int64).tolist()
 
 
-def _signed_area(clipper_path: list[tuple[int, int]]) -> float:
-    """Signed area of a clipper-coordinate polygon (shoelace formula)."""
-    n = len(clipper_path)
-    if n < 3:
-        return 0.0
-    area = 0.0
-    for i in range(n):
-        j = (i + 1) % n
-        area += clipper_path[i][0] * clipper_path[j][1]
-        area -= clipper_path[j][0] * clipper_path[i][1]
-    return area / 2.0
+def _from_clipper(path: list[tuple[int, int]]) -> Polyline:
+    return np.asarray(path, dtype=np.float64).reshape(-1, 2) / CLIPPER_SCALE
 
 
-def _collect_polytree(node, result: list[list[Point]]) -> None:
-    """Recursively collect all contours from a pyclipper PolyTree.
+def _twice_area(poly: Polyline) -> float:
+    """Twice the signed area of a polygon (shoelace, positive for CCW)."""
+    x, y = poly[:, 0], poly[:, 1]
+    return float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]) +
+                 x[-1] * y[0] - x[0] * y[-1])
 
-    Normalises winding directions for SVG fill-rule="nonzero":
-    - Outer contours → CCW (positive signed area)
-    - Hole contours  → CW  (negative signed area)
 
-    This way overlapping outers reinforce each other (both add to
-    the winding number), while holes subtract.
-    """
-    if node.Contour:
-        contour = node.Contour
-        area = _signed_area(contour)
-        if node.IsHole:
-            # Holes must be CW (negative area)
-            if area > 0:
-                contour = list(reversed(contour))
-        else:
-            # Outers must be CCW (positive area)
-            if area < 0:
-                contour = list(reversed(contour))
-        result.append(_from_clipper(contour))
-    for child in node.Childs:
-        _collect_polytree(child, result)
-
-
-def _ensure_ccw(poly: list[Point]) -> list[Point]:
+def _ensure_ccw(poly: Polyline) -> Polyline:
     """Ensure a polygon has CCW winding (positive signed area).
 
     Gradient-mode outlines can have either winding depending on the
     stroke's spatial direction.  Normalising to CCW before union
     ensures PFT_NONZERO treats all outer strokes consistently.
     """
-    n = len(poly)
-    if n < 3:
+    if len(poly) < 3:
         return poly
-    area = 0.0
-    for i in range(n):
-        j = (i + 1) % n
-        area += poly[i].x * poly[j].y - poly[j].x * poly[i].y
-    if area < 0:  # CW → reverse to CCW
-        return list(reversed(poly))
+    if _twice_area(poly) < 0:  # CW → reverse to CCW
+        return poly[::-1]
     return poly
 
 
-def _pyclipper_join(style: JoinStyle) -> int:
-    return {
-        JoinStyle.ROUND: pyclipper.JT_ROUND,
-        JoinStyle.MITER: pyclipper.JT_MITER,
-        JoinStyle.BEVEL: pyclipper.JT_SQUARE,
-    }[style]
+def _unit_normals(polyline: Polyline) -> Polyline:
+    """Per-vertex unit normals from central differences.
+
+    End vertices use one-sided differences; degenerate (zero-length)
+    directions yield a zero normal, like Point.normalized().
+    """
+    direction = np.empty_like(polyline)
+    direction[0] = polyline[1] - polyline[0]
+    direction[-1] = polyline[-1] - polyline[-2]
+    direction[1:-1] = polyline[2:] - polyline[:-2]
+    perp = np.column_stack((-direction[:, 1], direction[:, 0]))
+    ln = np.hypot(perp[:, 0], perp[:, 1])
+    ln[ln < 1e-12] = np.inf
+    return perp / ln[:, None]
+
+
+def _ribbon(polyline: Polyline, half_width) -> Polyline:
+    """Closed outline offsetting a polyline by half_width on both sides.
+
+    half_width is a scalar or a per-vertex array.  The result walks the
+    left side forward and the right side backward.
+    """
+    offset = _unit_normals(polyline) * np.reshape(half_width, (-1, 1))
+    return np.concatenate((polyline + offset, (polyline - offset)[::-1]))
+
+
+_JOIN_MAP = {
+    JoinStyle.ROUND: pyclipper.JT_ROUND,
+    JoinStyle.MITER: pyclipper.JT_MITER,
+    JoinStyle.BEVEL: pyclipper.JT_SQUARE,
+}
+
+_END_MAP = {
+    CapStyle.ROUND: pyclipper.ET_OPENROUND,
+    CapStyle.FLAT: pyclipper.ET_OPENBUTT,
+}
+
+
+def _generation_cfg(key: str, fallback: float) -> float:
+    try:
+        return float(settings.get_generation()[key])
+    except (KeyError, FileNotFoundError):
+        return fallback
 
 
-def _pyclipper_end(style: CapStyle) -> int:
-    return {
-        CapStyle.ROUND: pyclipper.ET_OPENROUND,
-        CapStyle.FLAT: pyclipper.ET_OPENBUTT,
-    }[style]
+def _unit_circle_table(segments: int) -> Polyline:
+    angles = np.arange(segments) * (2 * math.pi / segments)
+    return np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+# Unit-circle vertices for the segment counts decorations use
+_UNIT_CIRCLES = {n: _unit_circle_table(n) for n in (8, 12)}
+
+
+def _flourish_spiral(steps: int) -> Polyline:
+    """Flourish at angle 0 and unit size: radius halves over a 0.7π sweep."""
+    t = np.arange(steps + 1) / steps
+    r = 1 - t * 0.5
+    a = t * (math.pi * 0.7)
+    return np.column_stack((r * np.cos(a), r * np.sin(a)))
+
+
+_FLOURISH_SPIRAL = _flourish_spiral(8)
+
+
+@functools.lru_cache(maxsize=64)
+def _bar_corners(half_len: float, half_w: float) -> Polyline:
+    """Axis-aligned crossbar rectangle centred on the origin (read-only)."""
+    corners = np.array([
+        (-half_len, -half_w),
+        (half_len, -half_w),
+        (half_len, half_w),
+        (-half_len, half_w),
+    ])
+    corners.setflags(write=False)
+    return corners
 
 
 class StrokeExpander:
     """Convert center-line skeletons into filled polygon outlines."""
 
-    def __init__(self, style: AlphabetStyle):
+    def __init__(self, style: AlphabetStyle,
+                 render_tolerance: float = DEFAULT_RENDER_TOLERANCE):
         self._style = style
+        # Per-style constants, fixed for the expander's lifetime
+        self._gradient = style.stroke_width_mode == StrokeWidthMode.GRADIENT
+        self._offset_dist = style.stroke_width * CLIPPER_SCALE / 2.0
+        self._join = _JOIN_MAP[style.join_style]
+        self._end = _END_MAP[style.cap_style]
+        # Adaptive flattening tolerance based on stroke width, floored at
+        # what the intended output resolution can show
+        factor = _generation_cfg("flatten_tolerance_factor", 0.15)
+        self._flatten_tol = max(render_tolerance, style.stroke_width * factor)
 
     def expand_skeleton(self, skeleton: Skeleton) -> Outline:
         """Expand all strokes and decorations into a single Outline."""
-        all_polygons: list[list[Point]] = []
+        polylines = [pl for pl in map(self._stroke_polyline, skeleton.strokes)
+                     if pl is not None]
+        return self._expand_polylines(skeleton, polylines)
 
-        for stroke in skeleton.strokes:
-            polys = self._expand_stroke(stroke)
-            all_polygons.extend(polys)
+    def expand_skeletons(self, skeletons: list[Skeleton]) -> list[Outline]:
+        """Expand many skeletons, flattening all their curves in one pass.
+
+        Gives bit-identical outlines to expand_skeleton on each, since
+        flatten_many matches flatten_array exactly; batching the
+        flattening across a whole alphabet amortises NumPy's per-call
+        overhead, which a single glyph's handful of curves cannot.
+        """
+        if not skeletons:
+            return []
+        beziers, stroke_offsets, skeleton_offsets = segment_arrays(skeletons)
+        points, curve_offsets = flatten_many(beziers, self._flatten_tol)
+
+        # Drop the first point of every segment but a stroke's first (a
+        # duplicate of the previous segment's last), so each stroke's
+        # polyline becomes one contiguous view.
+        later = np.ones(len(beziers), dtype=bool)
+        later[stroke_offsets[:-1][stroke_offsets[:-1] < len(beziers)]] = False
+        keep = np.ones(len(points), dtype=bool)
+        keep[curve_offsets[:-1][later]] = False
+        kept = np.concatenate(([0], np.cumsum(keep)))
+        points = points[keep]
+        starts = kept[curve_offsets[stroke_offsets]]
+
+        outlines = []
+        for i, skeleton in enumerate(skeletons):
+            polylines = []
+            for j in range(skeleton_offsets[i], skeleton_offsets[i + 1]):
+                polyline = points[starts[j]:starts[j + 1]]
+                if len(polyline) >= 2:
+                    polylines.append(polyline)
+            outlines.append(self._expand_polylines(skeleton, polylines))
+        return outlines
+
+    def _expand_polylines(self, skeleton: Skeleton,
+                          polylines: list[Polyline]) -> Outline:
+        """Offset flattened strokes, add decorations and union the lot."""
+        all_polygons: list[Polyline] = []
+        if self._gradient:
+            for polyline in polylines:
+                poly = self._build_gradient_outline(polyline)
+                all_polygons.append(_ensure_ccw(poly))
+        elif polylines:
+            # Static mode: uniform offset expansion.  Join and cap style
+            # are alphabet-wide, so every stroke goes into one offset call.
+            all_polygons.extend(self._offset_polylines(polylines))
 
         for dec in skeleton.decorations:
             polys = self._expand_decoration(dec)
@@ -126,54 +220,72 @@ class StrokeExpander:
         if len(all_polygons) > 1:
             all_polygons = self._union_polygons(all_polygons)
 
-        return Outline(polygons=all_polygons)
+        return Outline(arrays=all_polygons)
 
-    def _expand_stroke(self, stroke: Stroke) -> list[list[Point]]:
-        """Expand a single stroke into polygons via offset."""
-        s = self._style
+    def _stroke_polyline(self, stroke: Stroke) -> Polyline | None:
+        """Flatten a stroke's segments into one polyline (None if degenerate)."""
+        if not stroke.segments:
+            return None
 
         # Flatten all segments to polyline
-        polyline: list[Point] = []
-        for i, seg in enumerate(stroke.segments):
-            # Adaptive tolerance based on stroke width
-            tol = max(0.01, s.stroke_width * 0.15)
-            pts = flatten(seg, tolerance=tol)
-            if i == 0:
-                polyline.extend(pts)
-            else:
-                # Skip first point (duplicate of previous segment's last)
-                polyline.extend(pts[1:])
+        tol = self._flatten_tol
+        parts = [flatten_array(seg, tolerance=tol) for seg in stroke.segments]
+        if len(parts) == 1:
+            polyline = parts[0]
+        else:
+            # Skip each later segment's first point (duplicate of the
+            # previous segment's last); the slices are views, so the
+            # concatenate is the only copy
+            polyline = np.concatenate(
+                [parts[0]] + [p[1:] for p in parts[1:]])
 
         if len(polyline) < 2:
-            return []
+            return None
+        return polyline
 
-        if s.stroke_width_mode == StrokeWidthMode.GRADIENT:
-            poly = self._build_gradient_outline(polyline)
-            return [_ensure_ccw(poly)]
+    def _offset_polylines(self, polylines: list[Polyline]) -> list[Polyline]:
+        """Offset several polylines by stroke_width in a single pyclipper pass.
 
-        # Static mode: uniform offset expansion
-        return self._offset_polyline(polyline)
+        The offset result is already the union of the individual stroke
+        outlines.  If clipper rejects the batch, each polyline is retried
+        on its own so one bad path cannot sink the rest.
+        """
+        pco = pyclipper.PyclipperOffset()
 
-    def _offset_polyline(self, polyline: list[Point]) -> list[list[Point]]:
-        """Offset a polyline by stroke_width using pyclipper."""
-        s = self._style
-        offset_dist = s.stroke_width * CLIPPER_SCALE / 2.0
+        # One scale/round/cast pass for every stroke, then split the
+        # nested list back into per-stroke paths
+        flat = _to_clipper(np.concatenate(polylines))
+        paths = []
+        start = 0
+        for polyline in polylines:
+            stop = start + len(polyline)
+            paths.append(flat[start:stop])
+            start = stop
+
+        try:
+            pco.AddPaths(paths, self._join, self._end)
+            result = pco.Execute(self._offset_dist)
+        except pyclipper.ClipperException:
+            return [poly for polyline in polylines
+                    for poly in self._offset_polyline(polyline)]
 
+        return [_from_clipper(path) for path in result]
+
+    def _offset_polyline(self, polyline: Polyline) -> list[Polyline]:
+        """Offset a polyline by stroke_width using pyclipper."""
         pco = pyclipper.PyclipperOffset()
         clipper_path = _to_clipper(polyline)
-        join = _pyclipper_join(s.join_style)
-        end = _pyclipper_end(s.cap_style)
 
         try:
-            pco.AddPath(clipper_path, join, end)
-            result = pco.Execute(offset_dist)
+            pco.AddPath(clipper_path, self._join, self._end)
+            result = pco.Execute(self._offset_dist)
         except pyclipper.ClipperException:
             # Fallback: build a simple rectangle around the polyline
             return [self._fallback_outline(polyline)]
 
         return [_from_clipper(path) for path in result]
 
-    def _build_gradient_outline(self, polyline: list[Point]) -> list[Point]:
+    def _build_gradient_outline(self, polyline: Polyline) -> Polyline:
         """Build a gradient (calligraphic) stroke: thick at start, thin at end.
 
         Width interpolates linearly from stroke_width at t=0 to
@@ -181,51 +293,28 @@ class StrokeExpander:
         all strokes in the alphabet.
         """
         s = self._style
-        n = len(polyline)
-        if n < 2:
+        if len(polyline) < 2:
             return polyline
 
         w_start = s.stroke_width
         w_end = s.stroke_width * s.stroke_taper_ratio
 
         # Compute cumulative arc lengths for parameterisation
-        lengths = [0.0]
-        for i in range(1, n):
-            lengths.append(lengths[-1] + polyline[i - 1].distance_to(polyline[i]))
+        steps = np.diff(polyline, axis=0)
+        lengths = np.concatenate(([0.0], np.cumsum(np.hypot(steps[:, 0],
+                                                             steps[:, 1]))))
         total_len = lengths[-1]
         if total_len < 1e-12:
             return polyline
 
-        left_side: list[Point] = []
-        right_side: list[Point] = []
-
-        for i in range(n):
-            t = lengths[i] / total_len  # [0, 1] along stroke
-            width = (w_start + (w_end - w_start) * t) / 2.0
-
-            # Compute local normal
-            if i == 0:
-                direction = polyline[1] - polyline[0]
-            elif i == n - 1:
-                direction = polyline[-1] - polyline[-2]
-            else:
-                direction = polyline[i + 1] - polyline[i - 1]
-
-            norm = Point(-direction.y, direction.x).normalized()
+        t = lengths / total_len  # [0, 1] along stroke
+        width = (w_start + (w_end - w_start) * t) / 2.0
+        return _ribbon(polyline, width)
 
-            left_side.append(polyline[i] + norm * width)
-            right_side.append(polyline[i] - norm * width)
-
-        # Build closed polygon: left side forward + right side backward
-        right_side.reverse()
-        return left_side + right_side
-
-    def _expand_decoration(self, dec: Decoration) -> list[list[Point]]:
+    def _expand_decoration(self, dec: Decoration) -> list[Polyline]:
         """Expand a decoration into polygons."""
-        s = self._style
-
         if dec.kind == "dot":
-            if s.stroke_width_mode == StrokeWidthMode.GRADIENT:
+            if self._gradient:
                 return [_ensure_ccw(self._make_calligraphic_dot(dec))]
             return [self._make_circle(dec.position, dec.size)]
         elif dec.kind == "bar":
@@ -237,18 +326,14 @@ class StrokeExpander:
         return []
 
     def _make_circle(self, center: Point, radius: float,
-                      segments: int = 12) -> list[Point]:
+                      segments: int = 12) -> Polyline:
         """Generate a circle polygon."""
-        points: list[Point] = []
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            points.append(Point(
-                center.x + radius * math.cos(angle),
-                center.y + radius * math.sin(angle),
-            ))
-        return points
-
-    def _make_calligraphic_dot(self, dec: Decoration) -> list[Point]:
+        unit = _UNIT_CIRCLES.get(segments)
+        if unit is None:
+            unit = _unit_circle_table(segments)
+        return unit * radius + (center.x, center.y)
+
+    def _make_calligraphic_dot(self, dec: Decoration) -> Polyline:
         """Calligraphic dot: a short, thick, quickly tapering stroke."""
         s = self._style
         p = dec.position
@@ -261,52 +346,27 @@ class StrokeExpander:
 
         # 5-point polyline for the short stroke
         steps = 5
-        polyline = [Point(p.x + dx * (i / steps), p.y + dy * (i / steps))
-                    for i in range(steps + 1)]
+        t = np.arange(steps + 1) / steps
+        polyline = np.column_stack((p.x + dx * t, p.y + dy * t))
 
         # Build tapered outline: thick at start, very thin at end
         w_start = s.stroke_width * 1.3
         w_end = s.stroke_width * 0.1
-        n = len(polyline)
-
-        left_side: list[Point] = []
-        right_side: list[Point] = []
-
-        for i in range(n):
-            t = i / (n - 1)
-            width = (w_start + (w_end - w_start) * t) / 2.0
+        return _ribbon(polyline, (w_start + (w_end - w_start) * t) / 2.0)
 
-            if i < n - 1:
-                direction = polyline[i + 1] - polyline[i]
-            else:
-                direction = polyline[-1] - polyline[-2]
-
-            norm = Point(-direction.y, direction.x).normalized()
-            left_side.append(polyline[i] + norm * width)
-            right_side.append(polyline[i] - norm * width)
-
-        right_side.reverse()
-        return left_side + right_side
-
-    def _make_bar(self, dec: Decoration) -> list[list[Point]]:
+    def _make_bar(self, dec: Decoration) -> list[Polyline]:
         """Generate a crossbar polygon."""
         s = self._style
         half_len = dec.size / 2
         half_w = s.stroke_width / 2
         ca, sa = math.cos(dec.angle), math.sin(dec.angle)
 
-        corners = [
-            Point(-half_len, -half_w),
-            Point(half_len, -half_w),
-            Point(half_len, half_w),
-            Point(-half_len, half_w),
-        ]
-        rotated = [Point(p.x * ca - p.y * sa + dec.position.x,
-                         p.x * sa + p.y * ca + dec.position.y)
-                   for p in corners]
-        return [rotated]
-
-    def _make_serif(self, dec: Decoration) -> list[list[Point]]:
+        # Rotate the cached template, then move it into place
+        bar = _bar_corners(half_len, half_w) @ np.array([[ca, sa], [-sa, ca]])
+        bar += (dec.position.x, dec.position.y)
+        return [bar]
+
+    def _make_serif(self, dec: Decoration) -> list[Polyline]:
         """Generate a serif polygon based on style."""
         s = self._style
         sz = dec.size
@@ -317,41 +377,34 @@ class StrokeExpander:
         elif s.serif_style == SerifStyle.WEDGE:
             # Triangle
             p = dec.position
-            return [[
-                Point(p.x, p.y - sz * 0.3),
-                Point(p.x + sz, p.y),
-                Point(p.x - sz, p.y),
-            ]]
+            return [np.array([
+                (p.x, p.y - sz * 0.3),
+                (p.x + sz, p.y),
+                (p.x - sz, p.y),
+            ])]
         elif s.serif_style == SerifStyle.FLARE:
             # Wider circle
             return [self._make_circle(dec.position, sz * 1.2, 8)]
         return []
 
-    def _make_flourish(self, dec: Decoration) -> list[list[Point]]:
+    def _make_flourish(self, dec: Decoration) -> list[Polyline]:
         """Generate a small flourish curve as an outline."""
         # A tiny arc rendered as a thin polygon
         s = self._style
         p = dec.position
         sz = dec.size
-        ca, sa = math.cos(dec.angle), math.sin(dec.angle)
 
-        points: list[Point] = []
-        steps = 8
-        for i in range(steps + 1):
-            t = i / steps
-            # Spiral-like curve
-            r = sz * (1 - t * 0.5)
-            a = dec.angle + t * math.pi * 0.7
-            points.append(Point(p.x + r * math.cos(a),
-                                p.y + r * math.sin(a)))
+        # Spiral-like curve: the unit spiral rotated to the decoration's
+        # angle, scaled and moved into place
+        ca, sa = math.cos(dec.angle) * sz, math.sin(dec.angle) * sz
+        points = _FLOURISH_SPIRAL @ np.array([[ca, sa], [-sa, ca]])
+        points += (p.x, p.y)
 
         # Make it into a thin polygon
-        if len(points) < 2:
-            return []
         return self._offset_polyline_thin(points, s.stroke_width * 0.6)
 
-    def _offset_polyline_thin(self, polyline: list[Point],
-                               width: float) -> list[list[Point]]:
+    def _offset_polyline_thin(self, polyline: Polyline,
+                               width: float) -> list[Polyline]:
         """Simple offset for thin strokes."""
         pco = pyclipper.PyclipperOffset()
         clipper_path = _to_clipper(polyline)
@@ -363,58 +416,40 @@ class StrokeExpander:
             return []
         return [_from_clipper(path) for path in result]
 
-    def _union_polygons(self, polygons: list[list[Point]]) -> list[list[Point]]:
+    def _union_polygons(self, polygons: list[Polyline]) -> list[Polyline]:
         """Union all polygons using pyclipper boolean operations.
 
         Uses PFT_NONZERO so overlapping strokes merge correctly (overlap
-        regions stay filled), and Execute2 (PolyTree) to preserve hole
-        topology — interior holes from loops/diamonds are returned as
-        separate polygons with CW winding for nonzero SVG rendering.
+        regions stay filled).  The flat Execute result already has the
+        winding SVG fill-rule="nonzero" needs — outers CCW, holes CW —
+        so no PolyTree walk is required.  PFT_POSITIVE is not used: it
+        would drop the negative-winding lobes of self-crossing gradient
+        ribbons.
         """
         pc = pyclipper.Pyclipper()
 
         for poly in polygons:
-            cp = _to_clipper(poly)
-            if len(cp) < 3:
+            if len(poly) < 3:
                 continue
             try:
-                pc.AddPath(cp, pyclipper.PT_SUBJECT, True)
+                pc.AddPath(_to_clipper(poly), pyclipper.PT_SUBJECT, True)
             except pyclipper.ClipperException:
                 continue
 
         try:
-            tree = pc.Execute2(pyclipper.CT_UNION,
+            paths = pc.Execute(pyclipper.CT_UNION,
                                pyclipper.PFT_NONZERO,
                                pyclipper.PFT_NONZERO)
         except pyclipper.ClipperException:
             return polygons  # fallback: return un-unioned
 
-        # Walk the PolyTree and collect all contours (outers + holes)
-        result: list[list[Point]] = []
-        _collect_polytree(tree, result)
+        result = [_from_clipper(path) for path in paths]
         return result if result else polygons
 
-    def _fallback_outline(self, polyline: list[Point]) -> list[Point]:
+    def _fallback_outline(self, polyline: Polyline) -> Polyline:
         """Simple fallback: build parallel curves on each side."""
         s = self._style
-        w = s.stroke_width / 2
-        n = len(polyline)
-        if n < 2:
+        if len(polyline) < 2:
             return polyline
 
-        left: list[Point] = []
-        right: list[Point] = []
-
-        for i in range(n):
-            if i == 0:
-                d = polyline[1] - polyline[0]
-            elif i == n - 1:
-                d = polyline[-1] - polyline[-2]
-            else:
-                d = polyline[i + 1] - polyline[i - 1]
-            norm = Point(-d.y, d.x).normalized()
-            left.append(polyline[i] + norm * w)
-            right.append(polyline[i] - norm * w)
-
-        right.reverse()
-        return left + right
+        return _ribbon(polyline, s.stroke_width / 2)
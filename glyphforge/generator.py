@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import string
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 from .alphabet import Alphabet
 from .components import ComponentLibrary
-from .expansion import StrokeExpander
+from .expansion import DEFAULT_RENDER_TOLERANCE, StrokeExpander
 from .geometry import BoundingBox
-from .glyph import Glyph
+from .glyph import Glyph, Outline, Skeleton
 from .presets import get_preset
 from .rng import SeededRNG
 from .skeleton import SkeletonGenerator
@@ -22,11 +24,20 @@ class AlphabetGenerator:
     """Generate a complete alphabet from a seed."""
 
     def __init__(self, seed: int, preset: str | None = None,
-                 overrides: dict | None = None):
+                 overrides: dict | None = None, workers: int = 1,
+                 processes: bool = False,
+                 render_tolerance: float = DEFAULT_RENDER_TOLERANCE):
         self._seed = seed
         self._rng = SeededRNG(seed)
         self._preset = preset
         self._overrides = overrides or {}
+        # Workers for per-glyph skeleton generation and stroke expansion;
+        # 1 keeps everything serial.  processes=True uses worker processes
+        # instead of threads.
+        self._workers = workers
+        self._processes = processes
+        # Finest curve flattening tolerance (em units) worth producing
+        self._render_tolerance = render_tolerance
 
     def generate(self) -> Alphabet:
         """Generate a complete 26-glyph alphabet."""
@@ -37,20 +48,26 @@ class AlphabetGenerator:
         comp_rng = self._rng.fork("components")
         components = ComponentLibrary(comp_rng, style)
 
-        # 3. Generate skeletons
-        skel_gen = SkeletonGenerator(self._rng, style, components)
-        skeletons = skel_gen.generate_all()
+        pool = self._make_pool()
+        try:
+            # 3. Generate skeletons
+            skel_gen = SkeletonGenerator(self._rng, style, components)
+            skeletons = skel_gen.generate_all(self._map_fn(pool, len(LABELS)))
+
+            # 4. Expand strokes
+            expander = StrokeExpander(style, self._render_tolerance)
+            outlines = self._expand_all(expander, skeletons, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
-        # 4. Expand strokes
-        expander = StrokeExpander(style)
         glyphs: list[Glyph] = []
 
         # Reference bbox for validation
         total_h = style.cap_height + style.descender_depth
         ref_bbox = BoundingBox(0, 0, style.glyph_width, total_h)
 
-        for i, skeleton in enumerate(skeletons):
-            outline = expander.expand_skeleton(skeleton)
+        for i, (skeleton, outline) in enumerate(zip(skeletons, outlines)):
             glyph = Glyph(
                 label=LABELS[i],
                 index=i,
@@ -72,6 +89,42 @@ class AlphabetGenerator:
             preset_name=self._preset,
         )
 
+    def _make_pool(self) -> Executor | None:
+        """Worker pool for per-glyph work, or None when running serially."""
+        if self._workers <= 1:
+            return None
+        if self._processes:
+            return ProcessPoolExecutor(max_workers=self._workers)
+        return ThreadPoolExecutor(max_workers=self._workers)
+
+    def _map_fn(self, pool: Executor | None, count: int):
+        """A map over *count* items: the pool's, in even chunks, or map."""
+        if pool is None:
+            return map
+        return functools.partial(pool.map,
+                                 chunksize=-(-count // self._workers))
+
+    def _expand_all(self, expander: StrokeExpander, skeletons: list[Skeleton],
+                    pool: Executor | None) -> list[Outline]:
+        """Expand every skeleton, across the worker pool if there is one.
+
+        Pooled runs hand each worker an even chunk for expand_skeletons,
+        the same function serial runs call on the whole list.  Expansion
+        draws no random numbers and its result per glyph does not depend
+        on the batch, so the outlines are the same however the glyphs are
+        split.  With processes=True the expander and skeletons are
+        pickled to the workers, which only pays off when expansion
+        outweighs that transfer.
+        """
+        if pool is None or len(skeletons) < 4:
+            return expander.expand_skeletons(skeletons)
+        size = -(-len(skeletons) // self._workers)
+        chunks = [skeletons[i:i + size]
+                  for i in range(0, len(skeletons), size)]
+        return [outline
+                for chunk in pool.map(expander.expand_skeletons, chunks)
+                for outline in chunk]
+
     def _build_style(self) -> AlphabetStyle:
         """Build style from preset/random + overrides."""
         if self._preset:
@@ -6,6 +6,8 @@ import math
 from dataclasses import dataclass
 from typing import Sequence
 
+import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class Point:
@@ -82,6 +84,17 @@ class BoundingBox:
         ys = [p.y for p in points]
         return BoundingBox(min(xs), min(ys), max(xs), max(ys))
 
+    @staticmethod
+    def from_array(points: np.ndarray) -> BoundingBox:
+        """Bounds of an (N, 2) coordinate array via NumPy reductions.
+
+        Point sequences stay on from_points: converting them to an array
+        first costs more than the Python min/max it would replace.
+        """
+        x_min, y_min = points.min(axis=0).tolist()
+        x_max, y_max = points.max(axis=0).tolist()
+        return BoundingBox(x_min, y_min, x_max, y_max)
+
     @property
     def width(self) -> float:
         return self.x_max - self.x_min
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Sequence
 
+import numpy as np
+
 from .geometry import BoundingBox, Point
 
 
@@ -15,6 +17,9 @@ class CubicBezier:
     p1: Point
     p2: Point
     p3: Point
+    # Set by make_line: control points lie evenly on the chord, so the
+    # curve is the segment P0 → P3 traversed at constant speed
+    is_line: bool = field(default=False, compare=False)
 
 
 @dataclass(slots=True)
@@ -68,18 +73,90 @@ class Skeleton:
         return BoundingBox.from_points(all_pts)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False, init=False)
 class Outline:
-    """Filled outline of a glyph — polygons ready for SVG rendering."""
-    # Each polygon is a list of points (closed path, CW=filled, CCW=hole)
-    polygons: list[list[Point]] = field(default_factory=list)
+    """Filled outline of a glyph — polygons ready for SVG rendering.
+
+    Stored as one (N, 2) float64 array per polygon (closed path,
+    CCW=filled, CW=hole); the Point lists in .polygons are built from
+    them on first access.  The arrays are treated as immutable: they
+    are held as read-only copies, and assigning a new .arrays list drops
+    everything derived from the old one.
+
+    Outline(polygons=...) still accepts Point lists, as before the
+    arrays existed.
+    """
+    arrays: list[np.ndarray]
+    _polygons: list[list[Point]] | None = field(init=False, default=None,
+                                                repr=False)
+    # SVG path data per viewbox mapping, filled by svg_export
+    _path_cache: dict[tuple, str] | None = field(init=False, default=None,
+                                                 repr=False)
+
+    def __init__(self, arrays: Sequence[np.ndarray] | None = None,
+                 polygons: list[list[Point]] | None = None):
+        if polygons is not None:
+            if arrays is not None:
+                raise ValueError("Pass either arrays or polygons, not both")
+            arrays = _points_to_arrays(polygons)
+        self.arrays = [] if arrays is None else arrays
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == "arrays":
+            value = [_read_only(arr) for arr in value]
+            object.__setattr__(self, "_polygons", None)
+            object.__setattr__(self, "_path_cache", None)
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_points(cls, polygons: list[list[Point]]) -> Outline:
+        """Outline from polygons given as Point lists."""
+        return cls(polygons=polygons)
+
+    @property
+    def polygons(self) -> list[list[Point]]:
+        """Each polygon as a list of Points."""
+        if self._polygons is None:
+            polygons = []
+            for arr in self.arrays:
+                xs, ys = arr.T.tolist()
+                polygons.append(list(map(Point, xs, ys)))
+            self._polygons = polygons
+        return self._polygons
 
     @property
     def bounds(self) -> BoundingBox:
-        all_pts = [p for poly in self.polygons for p in poly]
-        if not all_pts:
+        if not any(len(arr) for arr in self.arrays):
             return BoundingBox(0, 0, 0, 0)
-        return BoundingBox.from_points(all_pts)
+        return BoundingBox.from_array(np.concatenate(self.arrays))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Outline):
+            return NotImplemented
+        return (len(self.arrays) == len(other.arrays) and
+                all(np.array_equal(a, b)
+                    for a, b in zip(self.arrays, other.arrays)))
+
+
+def _points_to_arrays(polygons: list[list[Point]]) -> list[np.ndarray]:
+    """Point-list polygons as (N, 2) float64 arrays."""
+    return [np.array([(p.x, p.y) for p in poly],
+                     dtype=np.float64).reshape(-1, 2)
+            for poly in polygons]
+
+
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    """*arr* as a read-only float64 array, copied unless already read-only.
+
+    Copying writable input means later writes through the caller's
+    array cannot reach the outline.
+    """
+    if (isinstance(arr, np.ndarray) and arr.dtype == np.float64
+            and not arr.flags.writeable):
+        return arr
+    frozen = np.array(arr, dtype=np.float64)
+    frozen.flags.writeable = False
+    return frozen
 
 
 @dataclass(slots=True)
@@ -94,3 +171,26 @@ class Glyph:
     @property
     def bounds(self) -> BoundingBox:
         return self.outline.bounds
+
+
+def segment_arrays(skeletons: Sequence[Skeleton]
+                   ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Every segment of many skeletons in one contiguous (M, 4, 2) array.
+
+    Returns (segments, stroke_offsets, skeleton_offsets): stroke j owns
+    segment rows stroke_offsets[j]:stroke_offsets[j + 1], strokes being
+    numbered across all skeletons, and skeleton i owns strokes
+    skeleton_offsets[i]:skeleton_offsets[i + 1].  Slicing gives views.
+    """
+    strokes = [stroke for sk in skeletons for stroke in sk.strokes]
+    coords = [c for stroke in strokes for seg in stroke.segments
+              for c in (seg.p0.x, seg.p0.y, seg.p1.x, seg.p1.y,
+                        seg.p2.x, seg.p2.y, seg.p3.x, seg.p3.y)]
+    stroke_offsets = np.zeros(len(strokes) + 1, dtype=np.intp)
+    np.cumsum([len(stroke.segments) for stroke in strokes],
+              out=stroke_offsets[1:])
+    skeleton_offsets = np.zeros(len(skeletons) + 1, dtype=np.intp)
+    np.cumsum([len(sk.strokes) for sk in skeletons],
+              out=skeleton_offsets[1:])
+    segments = np.array(coords, dtype=np.float64).reshape(-1, 4, 2)
+    return segments, stroke_offsets, skeleton_offsets
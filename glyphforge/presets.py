@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Mapping
+
 from .style import AlphabetStyle, CapStyle, JoinStyle, SerifStyle, StrokeWidthMode
 
-PRESETS: dict[str, AlphabetStyle] = {
+# Keys are lowercase.  AlphabetStyle is frozen and the mapping read-only,
+# so a preset can be handed out as-is: overrides build a new style.
+PRESETS: Mapping[str, AlphabetStyle] = MappingProxyType({
     "angular": AlphabetStyle(
         curvature_bias=0.1,
         loop_probability=0.02,
@@ -125,16 +130,16 @@ PRESETS: dict[str, AlphabetStyle] = {
         flourish_probability=0.08,
         control_point_jitter=0.05,
     ),
-}
+})
 
 
 def get_preset(name: str) -> AlphabetStyle:
     """Return a preset by name. Raises ValueError if unknown."""
-    key = name.lower()
-    if key not in PRESETS:
+    style = PRESETS.get(name.lower())
+    if style is None:
         available = ", ".join(sorted(PRESETS))
         raise ValueError(f"Unknown preset {name!r}. Available: {available}")
-    return PRESETS[key]
+    return style
 
 
 def list_presets() -> list[str]:
@@ -11,6 +11,10 @@ _DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "settings.json")
 
 _cache: dict[str, Any] | None = None
 _cache_path: str | None = None
+# Resolved get_range/get_allowed results for the cached settings; reset
+# whenever the settings are (re)loaded
+_ranges: dict[str, tuple[float, float]] = {}
+_allowed: dict[str, tuple[str, ...]] = {}
 
 
 def load(path: str | None = None) -> dict[str, Any]:
@@ -25,9 +29,12 @@ def load(path: str | None = None) -> dict[str, Any]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Settings file not found: {path}")
 
-    with open(path) as f:
-        _cache = json.load(f)
+    # One binary read; json.loads detects the UTF encoding itself
+    with open(path, "rb") as f:
+        _cache = json.loads(f.read())
     _cache_path = path
+    _ranges.clear()
+    _allowed.clear()
     return _cache
 
 
@@ -42,20 +49,27 @@ def reload(path: str | None = None) -> dict[str, Any]:
 def get_range(param: str) -> tuple[float, float]:
     """Get the (min, max) range for a numerical parameter."""
     settings = load()
-    ranges = settings.get("parameter_ranges", {})
-    if param not in ranges:
-        raise KeyError(f"No range defined for parameter: {param!r}")
-    lo, hi = ranges[param]
-    return (float(lo), float(hi))
+    resolved = _ranges.get(param)
+    if resolved is None:
+        ranges = settings.get("parameter_ranges", {})
+        if param not in ranges:
+            raise KeyError(f"No range defined for parameter: {param!r}")
+        lo, hi = ranges[param]
+        resolved = _ranges[param] = (float(lo), float(hi))
+    return resolved
 
 
-def get_allowed(param: str) -> list[str]:
+def get_allowed(param: str) -> tuple[str, ...]:
     """Get allowed values for an enum parameter."""
     settings = load()
-    allowed = settings.get("allowed_values", {})
-    if param not in allowed:
-        raise KeyError(f"No allowed values defined for parameter: {param!r}")
-    return allowed[param]
+    resolved = _allowed.get(param)
+    if resolved is None:
+        allowed = settings.get("allowed_values", {})
+        if param not in allowed:
+            raise KeyError(
+                f"No allowed values defined for parameter: {param!r}")
+        resolved = _allowed[param] = tuple(allowed[param])
+    return resolved
 
 
 def get_validation() -> dict[str, Any]:
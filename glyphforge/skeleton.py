@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import math
+from typing import NamedTuple
 
 from .bezier import make_arc, make_line, make_s_curve
 from .components import ComponentLibrary
@@ -11,15 +13,35 @@ from .glyph import CubicBezier, Decoration, Skeleton, Stroke
 from .rng import SeededRNG
 from .style import AlphabetStyle
 from .templates import (
-    TEMPLATES,
     AnchorPoint,
     DecorationSpec,
     StrokeSpec,
     TemplateSpec,
     select_templates,
+    template_base_name,
+    template_spec,
 )
 
 
+class _StyleDerived(NamedTuple):
+    """Loop-invariant values derived from an AlphabetStyle."""
+    glyph_height: float        # cap height + descender depth
+    bulge_mod: float           # template bulge scale from curvature_bias
+    slight_sigma: float        # spread of near-straight segments' bulge
+    s_curve_p: float | None    # S-curve chance, None if curves are tame
+
+
+@functools.lru_cache(maxsize=256)
+def _style_derived(style: AlphabetStyle) -> _StyleDerived:
+    return _StyleDerived(
+        glyph_height=style.cap_height + style.descender_depth,
+        bulge_mod=0.3 + 0.7 * style.curvature_bias,
+        slight_sigma=style.control_point_jitter * 0.5,
+        s_curve_p=(style.inflection_frequency * 0.3
+                   if style.curvature_bias > 0.5 else None),
+    )
+
+
 class SkeletonGenerator:
     """Generate 26 glyph skeletons from templates + style."""
 
@@ -27,31 +49,32 @@ class SkeletonGenerator:
                  components: ComponentLibrary):
         self._rng = rng.fork("skeleton")
         self._style = style
+        self._derived = _style_derived(style)
         self._components = components
 
-    def generate_all(self) -> list[Skeleton]:
-        """Generate 26 skeletons, one per glyph."""
-        template_names = select_templates(self._rng)
-        skeletons: list[Skeleton] = []
-
-        for i, tname in enumerate(template_names):
-            glyph_rng = self._rng.fork(f"glyph_{i:02d}")
-            skeleton = self._generate_one(tname, glyph_rng)
-            skeleton.template_name = tname.split("_v")[0]  # strip variant suffix
-            skeletons.append(skeleton)
-
-        return skeletons
-
-    def _generate_one(self, template_name: str, rng: SeededRNG) -> Skeleton:
-        """Generate a single glyph skeleton from a template."""
-        # Resolve template (strip variant suffix for lookup)
-        base_name = template_name.split("_v")[0]
-        if base_name not in TEMPLATES:
-            base_name = template_name
-        template_func = TEMPLATES[base_name]
+    def generate_all(self, map_fn=map) -> list[Skeleton]:
+        """Generate 26 skeletons, one per glyph.
 
-        # Generate template spec
-        spec: TemplateSpec = template_func(rng, self._style)
+        map_fn runs the per-glyph builder over the glyphs; pass an
+        executor's map to spread them over workers.  Each glyph draws
+        from its own fork, so the result is the same either way.
+        """
+        template_names = select_templates(self._rng)
+        return list(map_fn(self._generate_indexed,
+                           range(len(template_names)), template_names))
+
+    def _generate_indexed(self, index: int, template_name: str) -> Skeleton:
+        """Generate glyph number *index* from its own forked RNG."""
+        glyph_rng = self._rng.fork(f"glyph_{index:02d}")
+        base_name = template_base_name(template_name)
+        skeleton = self._generate_one(base_name, glyph_rng)
+        skeleton.template_name = base_name
+        return skeleton
+
+    def _generate_one(self, base_name: str, rng: SeededRNG) -> Skeleton:
+        """Generate a single glyph skeleton from a registry template."""
+        # Shared template spec (read-only)
+        spec: TemplateSpec = template_spec(base_name, rng, self._style)
 
         # Convert to skeleton
         strokes = [self._spec_to_stroke(ss, rng) for ss in spec.strokes]
@@ -71,87 +94,73 @@ class SkeletonGenerator:
     def _spec_to_stroke(self, spec: StrokeSpec, rng: SeededRNG) -> Stroke:
         """Convert a StrokeSpec (anchor points) to a Stroke (bezier curves)."""
         s = self._style
+        d = self._derived
         anchors = spec.anchors
 
-        # Apply jitter to anchor positions
-        jittered: list[Point] = []
+        # Jitter anchors, clamp to [0, 1]² and scale to glyph metrics in
+        # one pass (y: 0 = top of cap, 1 = bottom of descender)
+        gauss = rng.gauss
+        anchor_sigma = s.anchor_jitter
+        w = s.glyph_width
+        h = d.glyph_height
+        scaled: list[Point] = []
         for ap in anchors:
-            jx = ap.x + rng.gauss(0, s.anchor_jitter)
-            jy = ap.y + rng.gauss(0, s.anchor_jitter)
-            # Clamp to [0, 1]
-            jx = max(0.0, min(1.0, jx))
-            jy = max(0.0, min(1.0, jy))
-            jittered.append(Point(jx, jy))
-
-        # Scale to glyph metrics
-        scaled = self._scale_to_metrics(jittered)
-
-        # Build bezier segments between consecutive anchor points
+            jx = ap.x + gauss(0, anchor_sigma)
+            jy = ap.y + gauss(0, anchor_sigma)
+            jx = jx if 0.0 < jx <= 1.0 else (1.0 if jx > 1.0 else 0.0)
+            jy = jy if 0.0 < jy <= 1.0 else (1.0 if jy > 1.0 else 0.0)
+            scaled.append(Point(jx * w, jy * h))
+
+        # Build bezier segments between consecutive anchor points.  The
+        # coin flips stay inside the loop, since their draws interleave
+        # with the jitter draws.
+        bulge_mod = d.bulge_mod
+        cp_jitter = s.control_point_jitter
+        slight_sigma = d.slight_sigma
+        s_curve_p = d.s_curve_p
+        curvature_bias = s.curvature_bias
+        coin = rng.coin
         segments: list[CubicBezier] = []
         for j in range(len(scaled) - 1):
             p0 = scaled[j]
             p1 = scaled[j + 1]
-            bulge = anchors[j].bulge
-
-            # Modulate bulge by curvature_bias
-            effective_bulge = bulge * (0.3 + 0.7 * s.curvature_bias)
-
-            # Add control point jitter
-            cp_jitter = s.control_point_jitter
+            effective_bulge = anchors[j].bulge * bulge_mod
 
+            # The kind decision draws first, then the control point jitter
             if abs(effective_bulge) < 0.01:
                 # Nearly straight — add slight curvature based on style
-                slight = rng.gauss(0, cp_jitter * 0.5) * s.curvature_bias
-                seg = make_arc(p0, p1, slight)
-            elif s.curvature_bias > 0.5 and rng.coin(s.inflection_frequency * 0.3):
+                slight = gauss(0, slight_sigma) * curvature_bias
+                jitter = self._control_point_jitter(cp_jitter, rng)
+                seg = make_arc(p0, p1, slight, jitter)
+            elif s_curve_p is not None and coin(s_curve_p):
                 # S-curve variant
-                seg = make_s_curve(p0, p1, effective_bulge * 0.7)
+                jitter = self._control_point_jitter(cp_jitter, rng)
+                seg = make_s_curve(p0, p1, effective_bulge * 0.7, jitter)
             else:
-                seg = make_arc(p0, p1, effective_bulge)
-
-            # Apply control point jitter
-            seg = self._jitter_control_points(seg, cp_jitter, rng)
+                jitter = self._control_point_jitter(cp_jitter, rng)
+                seg = make_arc(p0, p1, effective_bulge, jitter)
             segments.append(seg)
 
         return Stroke(segments=segments)
 
-    def _scale_to_metrics(self, points: list[Point]) -> list[Point]:
-        """Scale normalised [0,1]² points to glyph metric space."""
-        s = self._style
-        w = s.glyph_width
-        # Total height = cap_height + descender_depth
-        h = s.cap_height + s.descender_depth
-        # Baseline is at descender_depth from bottom
-        y_offset = s.descender_depth
+    @staticmethod
+    def _control_point_jitter(amount: float, rng: SeededRNG
+                              ) -> tuple[float, float, float, float]:
+        """Random (dx1, dy1, dx2, dy2) noise for a segment's control points.
 
-        scaled: list[Point] = []
-        for p in points:
-            sx = p.x * w
-            sy = p.y * h  # 0 = top of cap, 1 = bottom of descender
-            scaled.append(Point(sx, sy))
-        return scaled
-
-    def _jitter_control_points(self, seg: CubicBezier, amount: float,
-                                rng: SeededRNG) -> CubicBezier:
-        """Add random noise to control points (not endpoints)."""
-        jx1 = rng.gauss(0, amount)
-        jy1 = rng.gauss(0, amount)
-        jx2 = rng.gauss(0, amount)
-        jy2 = rng.gauss(0, amount)
-        return CubicBezier(
-            seg.p0,
-            Point(seg.p1.x + jx1, seg.p1.y + jy1),
-            Point(seg.p2.x + jx2, seg.p2.y + jy2),
-            seg.p3,
-        )
+        Applied by make_arc/make_s_curve as they build the segment, so no
+        unjittered intermediate curve is allocated.
+        """
+        gauss = rng.gauss
+        return (gauss(0, amount), gauss(0, amount),
+                gauss(0, amount), gauss(0, amount))
 
     def _spec_to_decoration(self, ds: DecorationSpec,
                              rng: SeededRNG) -> Decoration:
         """Convert a DecorationSpec to a Decoration."""
         s = self._style
         # Scale position
-        pos = Point(ds.x * s.glyph_width,
-                     ds.y * (s.cap_height + s.descender_depth))
+        pos = Point(ds.x * s.glyph_width, ds.y * self._derived.glyph_height)
         size = s.stroke_width * ds.size * 1.5
         return Decoration(
             kind=ds.kind,
@@ -174,10 +183,11 @@ class SkeletonGenerator:
             # Place dot near a random stroke endpoint
             stroke = rng.choice(strokes)
             ref = rng.choice([stroke.start, stroke.end])
-            offset = Point(rng.gauss(0, 0.03), rng.gauss(0, 0.03))
+            ox = rng.gauss(0, 0.03)
+            oy = rng.gauss(0, 0.03)
             decorations.append(Decoration(
                 kind="dot",
-                position=ref + offset + Point(0, -s.stroke_width * 2),
+                position=Point(ref.x + ox, ref.y + oy - s.stroke_width * 2),
                 size=s.stroke_width * 1.2,
             ))
 
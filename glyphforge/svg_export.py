@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-import svgwrite
+from xml.sax.saxutils import escape
+
+import numpy as np
 
 from .geometry import BoundingBox, Point
 from .glyph import Glyph, Outline
@@ -43,7 +46,7 @@ def _em_box(style: AlphabetStyle) -> BoundingBox:
 def _map_outline_to_viewbox(outline: Outline, target_bbox: BoundingBox,
                               margin: float = 0.05,
                               em_box: BoundingBox | None = None,
-                              ) -> list[list[tuple[float, float]]]:
+                              ) -> list[np.ndarray]:
     """Map outline polygons into a target viewbox with margin.
 
     If em_box is provided, it is used as the source coordinate space
@@ -67,16 +70,13 @@ def _map_outline_to_viewbox(outline: Outline, target_bbox: BoundingBox,
     ox = target_bbox.x_min + target_bbox.width * margin + (tw - src.width * scale) / 2
     oy = target_bbox.y_min + target_bbox.height * margin + (th - src.height * scale) / 2
 
-    result: list[list[tuple[float, float]]] = []
-    for poly in outline.polygons:
-        mapped = [((p.x - src.x_min) * scale + ox,
-                    (p.y - src.y_min) * scale + oy)
-                   for p in poly]
-        result.append(mapped)
-    return result
+    src_min = np.array([src.x_min, src.y_min])
+    offset = np.array([ox, oy])
+    return [(arr - src_min) * scale + offset
+            for arr in outline.arrays]
 
 
-def _compound_path_d(polygon_lists: list[list[tuple[float, float]]]) -> str:
+def _compound_path_d(polygon_lists: list[np.ndarray]) -> str:
     """Build an SVG path 'd' attribute from multiple polygons.
 
     Each polygon becomes a closed subpath. Used with fill-rule="evenodd"
@@ -86,26 +86,78 @@ def _compound_path_d(polygon_lists: list[list[tuple[float, float]]]) -> str:
     for poly in polygon_lists:
         if len(poly) < 3:
             continue
-        x0, y0 = poly[0]
-        segments = [f"M{x0:.2f},{y0:.2f}"]
-        for x, y in poly[1:]:
-            segments.append(f"L{x:.2f},{y:.2f}")
-        segments.append("Z")
-        parts.append("".join(segments))
+        # One %-format call per subpath instead of one f-string per point
+        template = "M%.2f,%.2f" + "L%.2f,%.2f" * (len(poly) - 1) + "Z"
+        parts.append(template % tuple(poly.ravel().tolist()))
     return "".join(parts)
 
 
-def _add_glyph_to_drawing(dwg, polygon_lists: list[list[tuple[float, float]]]) -> None:
-    """Add a glyph as a single compound path with nonzero fill rule.
+def _outline_path_d(outline: Outline, target_bbox: BoundingBox,
+                    margin: float, em_box: BoundingBox | None) -> str:
+    """Path data for an outline mapped into a viewbox, memoised per mapping.
+
+    Formatting the coordinates dominates SVG rendering, and previews
+    re-render the same glyphs at the same size, so the string is cached
+    on the outline keyed by everything that determines it.  Outline
+    arrays are read-only and reassigning them clears the cache, so a
+    cached string always matches the current geometry.
+    """
+    key = (target_bbox.x_min, target_bbox.y_min, target_bbox.x_max,
+           target_bbox.y_max, margin,
+           None if em_box is None else (em_box.x_min, em_box.y_min,
+                                        em_box.x_max, em_box.y_max))
+    cache = outline._path_cache
+    if cache is None:
+        cache = outline._path_cache = {}
+    d = cache.get(key)
+    if d is None:
+        d = cache[key] = _compound_path_d(
+            _map_outline_to_viewbox(outline, target_bbox, margin, em_box))
+    return d
+
+
+# -- SVG assembly ----------------------------------------------------------
+#
+# The documents are a handful of rects, paths and texts, so they are
+# written as strings directly.  The markup matches what svgwrite emitted:
+# same root attributes, attributes sorted by name.
+
+_XML_DECLARATION = '<?xml version="1.0" encoding="utf-8" ?>\n'
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+
+def _svg_open(width: int, height: int, defs: str = "") -> str:
+    """Root <svg> start tag plus a defs block for a width × height canvas."""
+    return (f'<svg baseProfile="full" height="{height}px" version="1.1" '
+            f'viewBox="0 0 {width} {height}" width="{width}px" '
+            'xmlns="http://www.w3.org/2000/svg" '
+            'xmlns:ev="http://www.w3.org/2001/xml-events" '
+            'xmlns:xlink="http://www.w3.org/1999/xlink">'
+            + (f"<defs>{defs}</defs>" if defs else "<defs />"))
+
+
+def _svg_element(tag: str, text: str | None = None, **attrs) -> str:
+    """One element; attribute names take hyphens for underscores."""
+    attr = " ".join(
+        f'{name}="{escape(str(value), _ATTR_ENTITIES)}"'
+        for name, value in sorted((k.replace("_", "-"), v)
+                                  for k, v in attrs.items()))
+    if text is None:
+        return f"<{tag} {attr} />"
+    return f"<{tag} {attr}>{escape(text)}</{tag}>"
+
+
+def _svg_glyph_path(d: str) -> str:
+    """A glyph's path data as a single compound path, nonzero fill.
 
     Winding directions are normalised during expansion (outers=CCW,
     holes=CW), so nonzero fill correctly renders overlapping strokes
     as solid while still cutting out interior holes.
     """
-    d = _compound_path_d(polygon_lists)
-    if d:
-        dwg.add(dwg.path(d=d, fill="black", stroke="none",
-                         fill_rule="nonzero"))
+    if not d:
+        return ""
+    return _svg_element("path", d=d, fill="black", fill_rule="nonzero",
+                        stroke="none")
 
 
 # -- Individual glyph SVG ------------------------------------------------
@@ -118,34 +170,45 @@ def glyph_to_svg(glyph: Glyph, size: int | None = None,
     """
     if size is None:
         size = _export_cfg("individual_size", 200)
-    dwg = svgwrite.Drawing(size=(f"{size}px", f"{size}px"),
-                            viewBox=f"0 0 {size} {size}")
-    dwg.add(dwg.rect(insert=(0, 0), size=(size, size), fill="white"))
-
     target = BoundingBox(0, 0, size, size)
     em = _em_box(style) if style else None
-    paths = _map_outline_to_viewbox(glyph.outline, target, margin=0.1,
-                                     em_box=em)
-    _add_glyph_to_drawing(dwg, paths)
+    d = _outline_path_d(glyph.outline, target, margin=0.1, em_box=em)
 
-    return dwg.tostring()
+    return "".join((
+        _svg_open(size, size),
+        _svg_element("rect", x=0, y=0, width=size, height=size,
+                     fill="white"),
+        _svg_glyph_path(d),
+        "</svg>",
+    ))
 
 
-def export_individual(alphabet: Alphabet, output_dir: str) -> list[str]:
-    """Export individual SVG files for each glyph. Returns file paths."""
+def export_individual(alphabet: Alphabet, output_dir: str,
+                      workers: int = 1) -> list[str]:
+    """Export individual SVG files for each glyph. Returns file paths.
+
+    All documents are rendered first, then written.  With workers > 1
+    the writes go through a thread pool, which only helps when file
+    writes are slow (e.g. a network drive); on a local disk the serial
+    loop is faster.
+    """
     os.makedirs(output_dir, exist_ok=True)
-    paths: list[str] = []
 
-    for glyph in alphabet:
-        filename = f"glyph_{glyph.label.lower()}.svg"
-        filepath = os.path.join(output_dir, filename)
-        svg_content = glyph_to_svg(glyph, style=alphabet.style)
+    # Rendering is pure Python, so it stays on this thread
+    files = [(os.path.join(output_dir, f"glyph_{glyph.label.lower()}.svg"),
+              glyph_to_svg(glyph, style=alphabet.style))
+             for glyph in alphabet]
 
+    def write_one(item: tuple[str, str]) -> str:
+        filepath, svg_content = item
         with open(filepath, "w") as f:
             f.write(svg_content)
-        paths.append(filepath)
+        return filepath
 
-    return paths
+    if workers <= 1:
+        return [write_one(item) for item in files]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(write_one, files))
 
 
 # -- Specimen sheet -------------------------------------------------------
@@ -162,43 +225,60 @@ def export_sheet(alphabet: Alphabet, path: str) -> str:
     total_w = cols * cell
     total_h = rows * (cell + label_h) + 40  # 40 for title
 
-    dwg = svgwrite.Drawing(path, size=(f"{total_w}px", f"{total_h}px"),
-                            viewBox=f"0 0 {total_w} {total_h}")
-    dwg.add(dwg.rect(insert=(0, 0), size=(total_w, total_h), fill="white"))
-
-    # Title
-    dwg.add(dwg.text(f"Seed: {alphabet.seed}", insert=(10, 20),
-                      font_size="14px", font_family="monospace", fill="#666"))
-    if alphabet.preset_name:
-        dwg.add(dwg.text(f"Preset: {alphabet.preset_name}", insert=(10, 36),
-                          font_size="12px", font_family="monospace", fill="#999"))
+    # One shared cell border, placed per glyph with <use>
+    border = _svg_element("rect", id="cell", x=0, y=0, width=cell,
+                          height=cell, fill="none", stroke="#eee",
+                          stroke_width=0.5)
 
     y_offset = 40
     em = _em_box(alphabet.style)
 
-    for i, glyph in enumerate(alphabet):
-        col = i % cols
-        row = i // cols
-        x0 = col * cell
-        y0 = y_offset + row * (cell + label_h)
-
-        # Cell border
-        dwg.add(dwg.rect(insert=(x0, y0), size=(cell, cell),
-                          fill="none", stroke="#eee", stroke_width=0.5))
-
-        # Glyph
-        target = BoundingBox(x0 + pad, y0 + pad,
-                              x0 + cell - pad, y0 + cell - pad)
-        paths = _map_outline_to_viewbox(glyph.outline, target, margin=0.05,
-                                         em_box=em)
-        _add_glyph_to_drawing(dwg, paths)
-
-        # Label
-        dwg.add(dwg.text(glyph.label, insert=(x0 + cell / 2, y0 + cell + label_h - 2),
-                          text_anchor="middle", font_size=f"{label_fs}px",
-                          font_family="monospace", fill="#888"))
-
-    dwg.save()
+    # Per-cell markup with only the position and label left to fill in
+    use_fmt = '<use x="%s" y="%s" xlink:href="#cell" />'
+    label_fmt = (_svg_element("text", "", x=0, y=0, text_anchor="middle",
+                              font_size=f"{label_fs}px",
+                              font_family="monospace", fill="#888")
+                 .replace('x="0" y="0">', 'x="%s" y="%s">%s', 1))
+
+    # Cells are written as they are built; the large buffer keeps that
+    # to a handful of write calls
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write = f.write
+        write(_XML_DECLARATION)
+        write(_svg_open(total_w, total_h, border))
+        write(_svg_element("rect", x=0, y=0, width=total_w, height=total_h,
+                           fill="white"))
+
+        # Title
+        write(_svg_element("text", f"Seed: {alphabet.seed}", x=10, y=20,
+                           font_size="14px", font_family="monospace",
+                           fill="#666"))
+        if alphabet.preset_name:
+            write(_svg_element("text", f"Preset: {alphabet.preset_name}",
+                               x=10, y=36, font_size="12px",
+                               font_family="monospace", fill="#999"))
+
+        for i, glyph in enumerate(alphabet):
+            col = i % cols
+            row = i // cols
+            x0 = col * cell
+            y0 = y_offset + row * (cell + label_h)
+
+            # Cell border
+            write(use_fmt % (x0, y0))
+
+            # Glyph
+            target = BoundingBox(x0 + pad, y0 + pad,
+                                  x0 + cell - pad, y0 + cell - pad)
+            write(_svg_glyph_path(
+                _outline_path_d(glyph.outline, target, margin=0.05,
+                                em_box=em)))
+
+            # Label
+            write(label_fmt % (x0 + cell / 2, y0 + cell + label_h - 2,
+                               escape(glyph.label)))
+
+        write("</svg>")
     return path
 
 
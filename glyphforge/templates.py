@@ -9,6 +9,9 @@ A template function signature:
 
 StrokeSpec = list of (x, y, bulge) tuples describing a path through
 anchor points. bulge controls curvature between consecutive points.
+
+Templates are fixed blueprints: none of them draws from rng or reads
+style, so template_spec() builds each one once and shares it.
 """
 
 from __future__ import annotations
@@ -495,13 +498,16 @@ TEMPLATES: dict[str, TemplateFunc] = {
     "ladder": _ladder,
 }
 
+# Registry order, the starting point for every template shuffle
+_NAMES: tuple[str, ...] = tuple(TEMPLATES)
+
 
 def select_templates(rng: SeededRNG, count: int = 26) -> list[str]:
     """Select *count* unique templates from the registry.
 
     If fewer than *count* templates exist, some are reused with a suffix.
     """
-    names = list(TEMPLATES.keys())
+    names = list(_NAMES)
     rng_sel = rng.fork("template_selection")
     rng_sel.shuffle(names)
 
@@ -515,3 +521,40 @@ def select_templates(rng: SeededRNG, count: int = 26) -> list[str]:
         selected.append(f"{names[i % len(names)]}_v{i // len(names) + 2}")
         i += 1
     return selected
+
+
+# Registry name -> built spec, filled on first lookup
+_SPECS: dict[str, TemplateSpec] = {}
+
+
+def template_spec(name: str, rng: SeededRNG,
+                  style: AlphabetStyle) -> TemplateSpec:
+    """Spec of registry template *name*, built once and then shared.
+
+    The returned spec is shared between glyphs and must not be mutated.
+    """
+    spec = _SPECS.get(name)
+    if spec is None:
+        spec = _SPECS[name] = TEMPLATES[name](rng, style)
+    return spec
+
+
+# Variant name -> registry name, filled on first lookup
+_BASE_NAMES: dict[str, str] = {}
+
+
+def template_base_name(name: str) -> str:
+    """Registry name of a selected template, without any "_vN" suffix.
+
+    Only a trailing variant suffix is stripped, so names that contain
+    "_v" themselves (e.g. "parallel_vert") are kept whole.
+    """
+    base = _BASE_NAMES.get(name)
+    if base is None:
+        base = name
+        if name not in TEMPLATES:
+            stem, _, variant = name.rpartition("_v")
+            if stem in TEMPLATES and variant.isdigit():
+                base = stem
+        _BASE_NAMES[name] = base
+    return base
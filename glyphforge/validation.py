@@ -4,38 +4,42 @@ from __future__ import annotations
 
 import math
 
-from .geometry import BoundingBox, Point
+import numpy as np
+
+from .geometry import BoundingBox
 from .glyph import Glyph, Outline
 
 
 # -- Ink coverage estimation ------------------------------------------------
 
-def estimate_ink_coverage(outline: Outline, bbox: BoundingBox) -> float:
+def estimate_ink_coverage(outline: Outline, bbox: BoundingBox,
+                          stop_above: float | None = None) -> float:
     """Estimate fraction of bounding box filled with ink.
 
-    Uses polygon area (shoelace formula) divided by bbox area.
+    Uses polygon area (shoelace formula) divided by bbox area.  With
+    *stop_above*, summing stops at the first polygon that takes the
+    coverage past it, so the result is then only known to exceed it.
     """
     if bbox.area < 1e-12:
         return 0.0
 
+    limit = math.inf if stop_above is None else stop_above * bbox.area
     total_area = 0.0
-    for poly in outline.polygons:
+    for poly in outline.arrays:
         total_area += abs(_polygon_area(poly))
+        if total_area > limit:
+            break
 
     return min(1.0, total_area / bbox.area)
 
 
-def _polygon_area(points: list[Point]) -> float:
-    """Signed area via shoelace formula."""
-    n = len(points)
-    if n < 3:
+def _polygon_area(points: np.ndarray) -> float:
+    """Signed area of an (N, 2) polygon via the shoelace formula."""
+    if len(points) < 3:
         return 0.0
-    area = 0.0
-    for i in range(n):
-        j = (i + 1) % n
-        area += points[i].x * points[j].y
-        area -= points[j].x * points[i].y
-    return area / 2.0
+    x, y = points[:, 0], points[:, 1]
+    return float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]) +
+                 x[-1] * y[0] - x[0] * y[-1]) / 2.0
 
 
 # -- Feature vector for distinctiveness ------------------------------------
@@ -43,29 +47,27 @@ def _polygon_area(points: list[Point]) -> float:
 def glyph_feature_vector(glyph: Glyph) -> list[float]:
     """Extract a feature vector for comparing glyph similarity.
 
-    Features:
+    Features, in order:
+    - Ink coverage
     - Bounding box aspect ratio
     - Number of polygons (proxy for connected components)
-    - Ink coverage
-    - Centroid position (normalised)
+    - Centroid position (normalised x, y)
     - Stroke count from skeleton
-    - Horizontal/vertical extent ratios
+    - Decoration count from skeleton
     """
     outline = glyph.outline
     bb = outline.bounds
 
     if bb.area < 1e-12:
-        return [0.0] * 8
+        return [0.0] * 7
 
     ink = estimate_ink_coverage(outline, bb)
     aspect = bb.width / max(bb.height, 1e-12)
-    n_polys = len(outline.polygons)
+    n_polys = len(outline.arrays)
 
     # Centroid of all polygon points
-    all_pts = [p for poly in outline.polygons for p in poly]
-    if all_pts:
-        cx = sum(p.x for p in all_pts) / len(all_pts)
-        cy = sum(p.y for p in all_pts) / len(all_pts)
+    if outline.arrays:
+        cx, cy = np.concatenate(outline.arrays).mean(axis=0).tolist()
         # Normalise to [0, 1] within bbox
         cx_norm = (cx - bb.x_min) / max(bb.width, 1e-12)
         cy_norm = (cy - bb.y_min) / max(bb.height, 1e-12)
@@ -76,13 +78,19 @@ def glyph_feature_vector(glyph: Glyph) -> list[float]:
     n_decorations = len(glyph.skeleton.decorations)
 
     return [ink, aspect, float(n_polys), cx_norm, cy_norm,
-            float(n_strokes), float(n_decorations),
-            float(len(glyph.skeleton.strokes))]
+            float(n_strokes), float(n_decorations)]
+
+
+def feature_matrix(glyphs: list[Glyph]) -> np.ndarray:
+    """Feature vectors of *glyphs* stacked into an (n, 7) array."""
+    if not glyphs:
+        return np.zeros((0, 7))
+    return np.array([glyph_feature_vector(g) for g in glyphs])
 
 
 def feature_distance(a: list[float], b: list[float]) -> float:
     """Euclidean distance between feature vectors."""
-    return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+    return math.dist(a, b)
 
 
 # -- Validation checks -----------------------------------------------------
@@ -115,7 +123,8 @@ def validate_glyph(glyph: Glyph, reference_bbox: BoundingBox) -> ValidationResul
     # Ink coverage
     min_ink = _val("min_ink_coverage", 0.05)
     max_ink = _val("max_ink_coverage", 0.85)
-    ink = estimate_ink_coverage(outline, reference_bbox)
+    # Past max_ink the exact figure no longer matters
+    ink = estimate_ink_coverage(outline, reference_bbox, stop_above=max_ink)
     if ink < min_ink:
         result.fail(f"Ink coverage too low: {ink:.2%} < {min_ink:.0%}")
     if ink > max_ink:
@@ -123,29 +132,36 @@ def validate_glyph(glyph: Glyph, reference_bbox: BoundingBox) -> ValidationResul
 
     # Connected components
     max_components = int(_val("max_connected_components", 8))
-    n_components = len(outline.polygons)
+    n_components = len(outline.arrays)
     if n_components > max_components:
         result.fail(f"Too many components: {n_components} > {max_components}")
 
     # Non-empty
-    if not outline.polygons:
+    if not outline.arrays:
         result.fail("Glyph has no outline polygons")
 
     return result
 
 
-def check_distinctiveness(glyphs: list[Glyph]) -> list[tuple[int, int, float]]:
+def check_distinctiveness(glyphs: list[Glyph],
+                          features: np.ndarray | None = None,
+                          ) -> list[tuple[int, int, float]]:
     """Find pairs of glyphs that are too similar.
 
+    *features* is their precomputed feature_matrix (e.g.
+    Alphabet.feature_matrix); it is built from *glyphs* if omitted.
     Returns list of (index_a, index_b, distance) for similar pairs.
     """
-    vectors = [glyph_feature_vector(g) for g in glyphs]
-    similar: list[tuple[int, int, float]] = []
-
-    for i in range(len(vectors)):
-        for j in range(i + 1, len(vectors)):
-            d = feature_distance(vectors[i], vectors[j])
-            if d < _val("min_distinctiveness", 0.15):
-                similar.append((i, j, d))
-
-    return similar
+    if len(glyphs) < 2:
+        return []
+    vectors = feature_matrix(glyphs) if features is None else features
+    threshold = _val("min_distinctiveness", 0.15)
+
+    # All pairwise distances at once; for 26 glyphs the full matrix is
+    # far cheaper than a spatial index
+    ii, jj = np.triu_indices(len(vectors), k=1)
+    diff = vectors[ii] - vectors[jj]
+    dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    close = np.flatnonzero(dist < threshold)
+    return list(zip(ii[close].tolist(), jj[close].tolist(),
+                    dist[close].tolist()))
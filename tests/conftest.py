@@ -0,0 +1,65 @@
+"""Shared test fixtures."""
+
+import os
+import pickle
+
+import pytest
+
+import glyphforge
+from glyphforge.rng import SeededRNG
+
+
+@pytest.fixture
+def rng() -> SeededRNG:
+    """A fresh SeededRNG(42) per test.
+
+    Function-scoped on purpose: draws mutate the stream, so a shared
+    instance would make results depend on test order.
+    """
+    return SeededRNG(42)
+
+
+@pytest.fixture(scope="session")
+def generate():
+    """glyphforge.generate, memoised for the test session.
+
+    Each call returns an independent copy of the first build for its
+    arguments, so tests may modify what they get.  Tests about
+    generation itself (determinism, parallelism) call
+    glyphforge.generate directly.
+    """
+    builds: dict[tuple, bytes] = {}
+
+    def cached(seed: int = 42, preset: str | None = None,
+               overrides: dict | None = None) -> glyphforge.Alphabet:
+        key = (seed, preset, tuple(sorted((overrides or {}).items())))
+        if key not in builds:
+            builds[key] = pickle.dumps(
+                glyphforge.generate(seed=seed, preset=preset,
+                                    overrides=overrides),
+                pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(builds[key])
+
+    return cached
+
+
+@pytest.fixture(scope="session")
+def alphabet(generate):
+    """The seed-42 alphabet, shared by tests that only read it."""
+    return generate(seed=42)
+
+
+@pytest.fixture(scope="session")
+def svg_dir(tmp_path_factory):
+    """One output directory for the SVG export tests."""
+    return str(tmp_path_factory.mktemp("svg"))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow when GF_FAST is set, for quick local loops."""
+    if not os.environ.get("GF_FAST"):
+        return
+    skip = pytest.mark.skip(reason="GF_FAST is set")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
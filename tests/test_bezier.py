@@ -1,8 +1,14 @@
 """Tests for bezier curve math."""
 
+import numpy as np
+
 from glyphforge.bezier import (
+    arc_length,
     evaluate,
+    evaluate_array,
     flatten,
+    flatten_array,
+    flatten_many,
     make_arc,
     make_line,
     make_s_curve,
@@ -32,6 +38,16 @@ def test_evaluate_midpoint_line():
     assert _approx(mid, Point(2, 0), tol=1e-4)
 
 
+def test_evaluate_matches_bernstein():
+    """Horner evaluation should agree with the Bernstein form."""
+    bez = CubicBezier(Point(0, 0), Point(1, 3), Point(3, 3), Point(4, 0))
+    for t in [0.0, 0.25, 0.5, 0.75, 1.0]:
+        u = 1.0 - t
+        expected = (u * u * u * bez.p0 + 3 * u * u * t * bez.p1 +
+                    3 * u * t * t * bez.p2 + t * t * t * bez.p3)
+        assert _approx(evaluate(bez, t), expected)
+
+
 def test_split_continuity():
     """Split should produce two curves that connect at split point."""
     bez = CubicBezier(Point(0, 0), Point(1, 3), Point(3, 3), Point(4, 0))
@@ -50,10 +66,20 @@ def test_split_preserves_curve():
     left, right = split(bez, 0.3)
 
     # Points on left half (t in [0, 0.3] of original)
-    for t in [0.0, 0.1, 0.2, 0.3]:
-        orig = evaluate(bez, t)
-        remapped = evaluate(left, t / 0.3)
-        assert _approx(orig, remapped, tol=1e-4)
+    ts = np.array([0.0, 0.1, 0.2, 0.3])
+    xs, ys = evaluate_array(bez, ts)
+    lxs, lys = evaluate_array(left, ts / 0.3)
+    assert np.allclose(xs, lxs, atol=1e-4)
+    assert np.allclose(ys, lys, atol=1e-4)
+
+
+def test_evaluate_array_matches_scalar():
+    """Batched evaluation should match per-t evaluate() exactly."""
+    bez = CubicBezier(Point(0, 0), Point(1, 2), Point(3, 2), Point(4, 0))
+    ts = np.linspace(0.0, 1.0, 9)
+    xs, ys = evaluate_array(bez, ts)
+    for t, x, y in zip(ts, xs, ys):
+        assert evaluate(bez, float(t)) == Point(x, y)
 
 
 def test_tangent_direction():
@@ -64,6 +90,17 @@ def test_tangent_direction():
     assert abs(tan.y) < 1e-6
 
 
+def test_line_short_circuit_matches_cubic():
+    """make_line curves take the chord shortcut with the same results."""
+    line = make_line(Point(1, 2), Point(4, 6))
+    cubic = CubicBezier(line.p0, line.p1, line.p2, line.p3)
+    assert line.is_line and not cubic.is_line
+    assert line == cubic
+    assert _approx(tangent(line, 0.3), tangent(cubic, 0.3), tol=1e-12)
+    assert flatten(line) == flatten(cubic)
+    assert all(half.is_line for half in split(line, 0.4))
+
+
 def test_normal_perpendicular():
     """Normal should be perpendicular to tangent."""
     bez = CubicBezier(Point(0, 0), Point(1, 2), Point(3, 2), Point(4, 0))
@@ -91,6 +128,62 @@ def test_flatten_straight_line():
     assert len(pts) == 2
 
 
+def test_arc_length_line():
+    """Arc length of a straight line should equal its chord."""
+    bez = make_line(Point(0, 0), Point(3, 4))
+    assert abs(arc_length(bez) - 5.0) < 1e-9
+
+
+def test_flatten_within_tolerance():
+    """Every point on the curve should lie close to the flattened polyline."""
+    bez = CubicBezier(Point(0, 0), Point(1, 3), Point(3, 3), Point(4, 0))
+    tol = 0.05
+    pts = flatten(bez, tolerance=tol)
+    assert pts[0] == bez.p0 and pts[-1] == bez.p3
+    for i in range(201):
+        q = evaluate(bez, i / 200)
+        best = float("inf")
+        for a, b in zip(pts, pts[1:]):
+            ab = b - a
+            u = max(0.0, min(1.0, (q - a).dot(ab) / ab.dot(ab)))
+            best = min(best, q.distance_to(a + ab * u))
+        assert best <= tol
+
+
+def test_flatten_many_matches_flatten():
+    """Batched flattening should reproduce flatten_array curve by curve."""
+    curves = [
+        CubicBezier(Point(0, 0), Point(1, 3), Point(3, 3), Point(4, 0)),
+        make_line(Point(0, 0), Point(10, 0)),
+        make_s_curve(Point(1, 1), Point(5, 2), 0.7),
+        make_arc(Point(0, 0), Point(0, 4), -0.4),
+    ]
+    beziers = np.array([[(p.x, p.y) for p in (c.p0, c.p1, c.p2, c.p3)]
+                        for c in curves])
+    points, offsets = flatten_many(beziers, tolerance=0.05)
+    assert len(offsets) == len(curves) + 1
+    for i, bez in enumerate(curves):
+        expected = flatten_array(bez, tolerance=0.05)
+        np.testing.assert_allclose(points[offsets[i]:offsets[i + 1]],
+                                   expected, atol=1e-9)
+
+
+def test_flatten_many_is_bit_identical():
+    """Batched and per-curve flattening must agree exactly, not just closely.
+
+    Serial generation expands skeletons in one batch while pooled runs
+    may split them differently, so any rounding difference would make
+    the output depend on the worker count.
+    """
+    beziers = np.random.default_rng(3).normal(scale=50.0, size=(500, 4, 2))
+    for tolerance in (0.5, 0.05):
+        points, offsets = flatten_many(beziers, tolerance=tolerance)
+        for i, ctrl in enumerate(beziers):
+            bez = CubicBezier(*(Point(float(x), float(y)) for x, y in ctrl))
+            assert np.array_equal(points[offsets[i]:offsets[i + 1]],
+                                  flatten_array(bez, tolerance=tolerance))
+
+
 def test_make_arc():
     """Arc with positive bulge should deviate from chord."""
     arc = make_arc(Point(0, 0), Point(4, 0), 0.5)
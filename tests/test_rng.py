@@ -3,12 +3,11 @@
 from glyphforge.rng import SeededRNG
 
 
-def test_determinism():
+def test_determinism(rng):
     """Same seed produces same sequence."""
-    r1 = SeededRNG(42)
-    r2 = SeededRNG(42)
+    other = SeededRNG(42)
     for _ in range(100):
-        assert r1.random() == r2.random()
+        assert rng.random() == other.random()
 
 
 def test_different_seeds():
@@ -38,25 +37,22 @@ def test_fork_isolation():
     assert va != vb
 
 
-def test_fork_independence():
+def test_fork_independence(rng):
     """Consuming values from one fork doesn't affect another."""
-    r1 = SeededRNG(42)
-    fa = r1.fork("a")
+    fa = rng.fork("a")
     # Consume some values from the base
     for _ in range(100):
-        r1.random()
+        rng.random()
     # Fork from a fresh base with same seed
-    r2 = SeededRNG(42)
-    fb = r2.fork("a")
+    fb = SeededRNG(42).fork("a")
     # Should be identical despite base divergence
     for _ in range(20):
         assert fa.random() == fb.random()
 
 
-def test_coin():
+def test_coin(rng):
     """Coin should return bool and respect probability."""
-    r = SeededRNG(42)
-    results = [r.coin(0.5) for _ in range(1000)]
+    results = [rng.coin(0.5) for _ in range(1000)]
     assert all(isinstance(v, bool) for v in results)
     # Roughly 50% true (allow wide margin)
     ratio = sum(results) / len(results)
@@ -1,5 +1,7 @@
 """Tests for style generation and presets."""
 
+from dataclasses import replace
+
 from glyphforge.rng import SeededRNG
 from glyphforge.style import (
     AlphabetStyle,
@@ -76,3 +78,20 @@ def test_preset_unknown():
         assert False, "Should raise"
     except ValueError:
         pass
+
+
+def test_preset_shared_and_immutable():
+    """Lookups are case-insensitive, shared, and untouched by overrides."""
+    style = get_preset("Flowing")
+    assert style is PRESETS["flowing"]
+    changed = apply_overrides(style, {"stroke_width": 0.2})
+    assert changed is not style
+    assert PRESETS["flowing"].stroke_width != 0.2
+
+
+def test_apply_overrides_matches_replace():
+    """Overrides should equal dataclasses.replace with converted enums."""
+    base = AlphabetStyle()
+    styled = apply_overrides(base, {"stroke_width": 0.2, "cap_style": "flat"})
+    assert styled == replace(base, stroke_width=0.2, cap_style=CapStyle.FLAT)
+    assert hash(styled) == hash(replace(styled))